@@ -35,7 +35,13 @@ class Action:
     outcome: Optional[Literal["positive", "negative", "neutral", "unknown"]] = None
     outcome_text: Optional[str] = None  # User's feedback
     outcome_recorded_at: Optional[datetime] = None
-    
+
+    def __post_init__(self):
+        # Lowercased once at ingest so pattern-detection loops don't
+        # re-lower the same text per comparison. Not a dataclass field:
+        # stays out of to_dict()/asdict().
+        self.action_text_lower = self.action_text.lower()
+
     def to_dict(self) -> Dict:
         """Serialize for storage."""
         data = asdict(self)
@@ -119,7 +125,7 @@ class Memory:
         self.actions.append(action)
         self.last_updated = datetime.utcnow()
         
-        logger.info(f"Action logged: {action_type} - {action_text}")
+        logger.info("Action logged: %s - %s", action_type, action_text)
         return action_id
 
     def record_outcome(
@@ -152,18 +158,18 @@ class Memory:
                 if outcome == "positive":
                     self.successful_suggestions[action.action_text] = \
                         self.successful_suggestions.get(action.action_text, 0) + 1
-                    logger.info(f"✓ Success: {action.action_text}")
+                    logger.info("✓ Success: %s", action.action_text)
                     
                 elif outcome == "negative":
                     self.failed_suggestions[action.action_text] = \
                         self.failed_suggestions.get(action.action_text, 0) + 1
                     self.dislikes.add(action.action_text)
-                    logger.warning(f"✗ Failed: {action.action_text}")
+                    logger.warning("✗ Failed: %s", action.action_text)
                 
                 self.last_updated = datetime.utcnow()
                 return True
         
-        logger.warning(f"Action {action_id} not found in memory")
+        logger.warning("Action %s not found in memory", action_id)
         return False
 
     def should_avoid_suggestion(self, suggestion: str) -> bool:
@@ -189,12 +195,13 @@ class Memory:
         Don't want to repeat the same thing too soon.
         """
         cutoff_date = datetime.utcnow() - timedelta(days=self.recent_action_window_days)
-        
+        suggestion_lower = suggestion.lower()
+
         for action in reversed(self.actions):
             if action.timestamp < cutoff_date:
                 break  # Older than window, stop checking
-            
-            if suggestion.lower() in action.action_text.lower():
+
+            if suggestion_lower in action.action_text_lower:
                 return True
         
         return False
@@ -242,13 +249,13 @@ class Memory:
         E.g., "raw_milk" (food safety), "aspirin" (pregnancy safety)
         """
         self.contraindications.add(suggestion.lower())
-        logger.warning(f"Added contraindication: {suggestion} ({reason})")
+        logger.warning("Added contraindication: %s (%s)", suggestion, reason)
 
     def add_allergy(self, allergen: str) -> None:
         """Record an allergy."""
         self.allergies.add(allergen.lower())
         self.contraindications.add(allergen.lower())
-        logger.warning(f"Added allergy: {allergen}")
+        logger.warning("Added allergy: %s", allergen)
 
     def to_dict(self) -> Dict:
         """Serialize for storage."""
@@ -49,21 +49,28 @@ class ReasoningEngine:
         state,  # MaternalBrainState
         memory,  # Memory
         safety,  # SafetyChecker
-    ) -> Tuple[ActionType, Dict, str]:
+    ) -> Tuple[ActionType, Dict, str, str]:
         """
         Main decision function. Picks ONE action.
-        
+
         Returns:
-            (action_type, action_details, reasoning)
+            (action_type, action_details, reasoning, display_name)
+
+        display_name is a short human-readable label for the chosen
+        action (the food, the suggestion, etc.), built here where we know
+        which detail key is canonical, so callers don't have to probe the
+        details dict.
         """
 
         # Step 1: Check for critical alerts
         alert = safety.check_state_for_alerts(state)
         if alert or safety.get_alerts():
+            details = {"alert": alert or safety.get_alerts()[0]}
             return (
                 ActionType.ALERT_MEDICAL,
-                {"alert": alert or safety.get_alerts()[0]},
-                "Critical state detected. Medical consultation needed."
+                details,
+                "Critical state detected. Medical consultation needed.",
+                str(details)
             )
 
         # Step 2: Check for critical symptoms
@@ -71,41 +78,47 @@ class ReasoningEngine:
             for symptom in state.symptoms:
                 is_safe, msg = safety.check_critical_symptom(symptom)
                 if not is_safe:
+                    details = {"symptom": symptom, "alert": msg}
                     return (
                         ActionType.ALERT_MEDICAL,
-                        {"symptom": symptom, "alert": msg},
-                        f"Critical symptom: {symptom}"
+                        details,
+                        f"Critical symptom: {symptom}",
+                        str(details)
                     )
 
         # Step 3: Should we even take action today?
         if not self._should_take_action_today(state, memory):
+            details = {"reason": "No urgent action needed"}
             return (
                 ActionType.OBSERVE,
-                {"reason": "No urgent action needed"},
-                "System observing. No action needed today."
+                details,
+                "System observing. No action needed today.",
+                str(details)
             )
 
         # Step 4: Identify most pressing nutrient
         pressing_nutrient = self._find_pressing_nutrient(state)
         if pressing_nutrient:
-            action_type, details, reason = self._suggest_for_nutrient(
+            action_type, details, reason, display_name = self._suggest_for_nutrient(
                 pressing_nutrient, state, memory, safety
             )
             if action_type != ActionType.OBSERVE:
                 self._record_decision(action_type, details, reason)
-                return (action_type, details, reason)
+                return (action_type, details, reason, display_name)
 
         # Step 5: If no nutrient action, check lifestyle
-        action_type, details, reason = self._suggest_lifestyle(state, memory, safety)
+        action_type, details, reason, display_name = self._suggest_lifestyle(state, memory, safety)
         if action_type != ActionType.OBSERVE:
             self._record_decision(action_type, details, reason)
-            return (action_type, details, reason)
+            return (action_type, details, reason, display_name)
 
         # Step 6: Default: check-in to gather info
+        details = {"question": "How are you feeling today?"}
         return (
             ActionType.CHECK_IN,
-            {"question": "How are you feeling today?"},
-            "Regular check-in to understand current state."
+            details,
+            "Regular check-in to understand current state.",
+            str(details)
         )
 
     def _should_take_action_today(self, state, memory) -> bool:
@@ -159,7 +172,7 @@ class ReasoningEngine:
         state,
         memory,
         safety
-    ) -> Tuple[ActionType, Dict, str]:
+    ) -> Tuple[ActionType, Dict, str, str]:
         """
         Suggest a food to address this nutrient.
         Uses memory to pick foods that worked before. Tries candidates
@@ -198,14 +211,17 @@ class ReasoningEngine:
                     "food": food,
                     "reason": f"Your {nutrient} levels seem low"
                 },
-                f"Suggesting {food} to address {nutrient}"
+                f"Suggesting {food} to address {nutrient}",
+                food
             )
 
         # No safe/valid candidates found
+        details = {"question": f"How have you been feeling about your {nutrient} intake?"}
         return (
             ActionType.CHECK_IN,
-            {"question": f"How have you been feeling about your {nutrient} intake?"},
-            f"No safe/valid food candidates for {nutrient}. Need user feedback."
+            details,
+            f"No safe/valid food candidates for {nutrient}. Need user feedback.",
+            str(details)
         )
 
     def _suggest_lifestyle(
@@ -213,25 +229,29 @@ class ReasoningEngine:
         state,
         memory,
         safety
-    ) -> Tuple[ActionType, Dict, str]:
+    ) -> Tuple[ActionType, Dict, str, str]:
         """
         Suggest lifestyle changes if nutrients are adequate.
         """
         if state.energy_level < 0.4 and state.sleep_quality < 0.5:
+            suggestion = "Try to get more sleep tonight"
             return (
                 ActionType.SUGGEST_REST,
-                {"suggestion": "Try to get more sleep tonight"},
-                "Low energy and poor sleep detected"
+                {"suggestion": suggestion},
+                "Low energy and poor sleep detected",
+                suggestion
             )
 
         if state.hydration_level < 0.4:
+            details = {"glasses": 3, "timing": "throughout the day"}
             return (
                 ActionType.SUGGEST_WATER,
-                {"glasses": 3, "timing": "throughout the day"},
-                "Hydration levels low"
+                details,
+                "Hydration levels low",
+                str(details)
             )
 
-        return (ActionType.OBSERVE, {}, "No urgent action")
+        return (ActionType.OBSERVE, {}, "No urgent action", "")
 
     def _get_foods_for_nutrient(self, nutrient: str) -> list:
         """
@@ -13,12 +13,110 @@ ML signals are merged in with a dampening factor.
 """
 
 from datetime import datetime
-from typing import Dict, Optional
+from enum import IntEnum
+from typing import Dict, Iterator, Optional
 import logging
 
+import numpy as np
+
+from app.knowledge.nutrition import NutritionKnowledgeBase
+
 logger = logging.getLogger(__name__)
 
 
+class PregnancyStage(IntEnum):
+    """Integer codes for pregnancy stages.
+
+    The stage strings stay canonical everywhere users and persistence
+    see them; the codes exist so numeric hot paths (ML feature prep)
+    can use an int directly instead of hashing the string each call.
+    """
+    NONE = 0
+    PLANNING = 1
+    FIRST_TRIMESTER = 2
+    SECOND_TRIMESTER = 3
+    THIRD_TRIMESTER = 4
+
+    @classmethod
+    def from_string(cls, stage: Optional[str]) -> "PregnancyStage":
+        return _STAGE_CODES.get(stage, cls.NONE)
+
+
+_STAGE_CODES: Dict[Optional[str], PregnancyStage] = {
+    None: PregnancyStage.NONE,
+    "planning": PregnancyStage.PLANNING,
+    "first_trimester": PregnancyStage.FIRST_TRIMESTER,
+    "second_trimester": PregnancyStage.SECOND_TRIMESTER,
+    "third_trimester": PregnancyStage.THIRD_TRIMESTER,
+}
+
+# Fixed nutrient ordering shared by all state vectors.
+# Derived from the knowledge base so state and knowledge never drift apart.
+NUTRIENT_INDEX: Dict[str, int] = {
+    nutrient: i for i, nutrient in enumerate(NutritionKnowledgeBase.NUTRIENTS)
+}
+
+
+class _NutrientVector:
+    """
+    Dict-compatible view over a fixed-order float32 vector.
+
+    Keeps the public mapping API intact (state.nutrition["iron"] etc.)
+    while letting hot paths operate on `.array` with vectorized NumPy
+    calls instead of per-nutrient Python loops.
+    """
+
+    __slots__ = ("array",)
+
+    def __init__(self, fill: float = 0.5, values: Optional[Dict[str, float]] = None):
+        self.array = np.full(len(NUTRIENT_INDEX), fill, dtype=np.float32)
+        if values:
+            self.update(values)
+
+    def __getitem__(self, nutrient: str) -> float:
+        return float(self.array[NUTRIENT_INDEX[nutrient]])
+
+    def __setitem__(self, nutrient: str, value: float) -> None:
+        self.array[NUTRIENT_INDEX[nutrient]] = value
+
+    def __contains__(self, nutrient: object) -> bool:
+        return nutrient in NUTRIENT_INDEX
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(NUTRIENT_INDEX)
+
+    def __len__(self) -> int:
+        return len(NUTRIENT_INDEX)
+
+    def get(self, nutrient: str, default=None):
+        idx = NUTRIENT_INDEX.get(nutrient)
+        if idx is None:
+            return default
+        return float(self.array[idx])
+
+    def keys(self):
+        return NUTRIENT_INDEX.keys()
+
+    def values(self):
+        return [float(v) for v in self.array]
+
+    def items(self):
+        return [(nutrient, float(self.array[i])) for nutrient, i in NUTRIENT_INDEX.items()]
+
+    def copy(self) -> Dict[str, float]:
+        """Return a plain dict snapshot (for serialization/logging)."""
+        return dict(self.items())
+
+    def update(self, values: Dict[str, float]) -> None:
+        for nutrient, value in values.items():
+            idx = NUTRIENT_INDEX.get(nutrient)
+            if idx is not None:
+                self.array[idx] = value
+
+    def __repr__(self) -> str:
+        return f"_NutrientVector({self.copy()!r})"
+
+
 class MaternalBrainState:
     """
     Represents the internal belief about the mother's
@@ -35,6 +133,9 @@ class MaternalBrainState:
     # Confidence threshold: Only act if we're confident in our belief
     MIN_CONFIDENCE_TO_ACT = 0.7
 
+    # Shared nutrient -> vector index mapping (see module-level NUTRIENT_INDEX)
+    _NUTRIENT_IDX: Dict[str, int] = NUTRIENT_INDEX
+
     def __init__(
         self,
         pregnancy_stage: Optional[str] = None,
@@ -51,14 +152,8 @@ class MaternalBrainState:
             age: Mother's age (optional, affects nutritional needs)
         """
         # Nutritional belief (0-1: how adequate is this nutrient?)
-        self.nutrition: Dict[str, float] = {
-            "iron": 0.5,
-            "protein": 0.5,
-            "calcium": 0.5,
-            "folic": 0.5,
-            "vitamin_b12": 0.5,
-            "iodine": 0.5
-        }
+        # Backed by a fixed-order NumPy vector; behaves like a dict.
+        self.nutrition = _NutrientVector(fill=0.5)
 
         # Physical state beliefs
         self.energy_level = 0.5
@@ -67,7 +162,7 @@ class MaternalBrainState:
         self.stress_level = 0.5
 
         # Contextual information
-        self.pregnancy_stage = pregnancy_stage  # Changes slowly
+        self.pregnancy_stage = pregnancy_stage  # Changes slowly (property: keeps int code in sync)
         self.breastfeeding = breastfeeding
         self.age = age
 
@@ -75,9 +170,7 @@ class MaternalBrainState:
         self.symptoms: set = set()
 
         # Confidence in our beliefs (0-1: how sure are we?)
-        self.confidence_in_state: Dict[str, float] = {
-            nutrient: 0.5 for nutrient in self.nutrition
-        }
+        self.confidence_in_state = _NutrientVector(fill=0.5)
 
         # Action history
         self.last_action: Optional[str] = None
@@ -88,6 +181,18 @@ class MaternalBrainState:
         self.last_updated = datetime.utcnow()
         self.update_count = 0
 
+    @property
+    def pregnancy_stage(self) -> Optional[str]:
+        """Pregnancy stage string ("planning", "first_trimester", ...)."""
+        return self._pregnancy_stage
+
+    @pregnancy_stage.setter
+    def pregnancy_stage(self, stage: Optional[str]) -> None:
+        self._pregnancy_stage = stage
+        # Precomputed once per (rare) stage change so per-prediction
+        # feature prep reads an int instead of probing a dict.
+        self.pregnancy_stage_code = int(PregnancyStage.from_string(stage))
+
     def apply_ml_signal(
         self,
         nutrient: str,
@@ -109,7 +214,7 @@ class MaternalBrainState:
             model_confidence: How accurate is this model? (0-1)
         """
         if nutrient not in self.nutrition:
-            logger.warning(f"Unknown nutrient: {nutrient}")
+            logger.warning("Unknown nutrient: %s", nutrient)
             return
 
         # Clamp prediction to valid range
@@ -134,10 +239,11 @@ class MaternalBrainState:
         self.last_updated = datetime.utcnow()
         self.update_count += 1
 
-        logger.debug(
-            f"Updated {nutrient}: {old_belief:.2f} → {new_belief:.2f} "
-            f"(confidence: {self.confidence_in_state[nutrient]:.2f})"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Updated %s: %.2f -> %.2f (confidence: %.2f)",
+                nutrient, old_belief, new_belief, self.confidence_in_state[nutrient]
+            )
 
     def apply_user_feedback(self, nutrient: str, direction: str) -> None:
         """
@@ -149,7 +255,7 @@ class MaternalBrainState:
             direction: "increase", "decrease", or "stable"
         """
         if nutrient not in self.nutrition:
-            logger.warning(f"Unknown nutrient: {nutrient}")
+            logger.warning("Unknown nutrient: %s", nutrient)
             return
 
         delta = {
@@ -172,8 +278,8 @@ class MaternalBrainState:
         self.last_updated = datetime.utcnow()
 
         logger.info(
-            f"User feedback: {nutrient} {direction} "
-            f"({old_belief:.2f} → {new_belief:.2f})"
+            "User feedback: %s %s (%.2f -> %.2f)",
+            nutrient, direction, old_belief, new_belief
         )
 
     def report_symptom(self, symptom: str) -> None:
@@ -186,7 +292,29 @@ class MaternalBrainState:
         """
         self.symptoms.add(symptom.lower())
         self.last_updated = datetime.utcnow()
-        logger.info(f"Symptom reported: {symptom}")
+        logger.info("Symptom reported: %s", symptom)
+
+    def report_symptoms(self, symptoms) -> None:
+        """
+        Batch variant of `report_symptom`: one set update and one
+        timestamp bump for a whole parsed turn.
+
+        Args:
+            symptoms: Iterable of symptom descriptions
+        """
+        self.symptoms.update(s.lower() for s in symptoms)
+        self.last_updated = datetime.utcnow()
+        logger.info("Symptoms reported: %s", symptoms)
+
+    def adjust_energy(self, delta: float) -> None:
+        """
+        Nudge the energy belief by delta, clamped to [0, 1].
+
+        Args:
+            delta: Signed adjustment (e.g. +0.1 for positive sentiment)
+        """
+        self.energy_level = max(0.0, min(1.0, self.energy_level + delta))
+        self.last_updated = datetime.utcnow()
 
     def clear_symptoms(self) -> None:
         """Clear reported symptoms (after taking action, symptoms may resolve)."""
@@ -266,13 +394,13 @@ class MaternalBrainState:
     def from_dict(cls, data: Dict) -> "MaternalBrainState":
         """Deserialize state from dict."""
         obj = cls(pregnancy_stage=data.get("pregnancy_stage"), breastfeeding=data.get("breastfeeding", False), age=data.get("age"))
-        obj.nutrition = data.get("nutrition", obj.nutrition)
+        obj.nutrition.update(data.get("nutrition", {}))
         obj.energy_level = data.get("energy_level", obj.energy_level)
         obj.hydration_level = data.get("hydration_level", obj.hydration_level)
         obj.sleep_quality = data.get("sleep_quality", obj.sleep_quality)
         obj.stress_level = data.get("stress_level", obj.stress_level)
         obj.symptoms = set(data.get("symptoms", []))
-        obj.confidence_in_state = data.get("confidence_in_state", obj.confidence_in_state)
+        obj.confidence_in_state.update(data.get("confidence_in_state", {}))
         obj.last_action = data.get("last_action")
         import datetime
 
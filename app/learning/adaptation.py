@@ -15,12 +15,25 @@ Mechanism:
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, NamedTuple, Optional
 import logging
 
+import numpy as np
+
+from app.core.state import NUTRIENT_INDEX
+
 logger = logging.getLogger(__name__)
 
 
+class LogEntry(NamedTuple):
+    """One adaptation-log record. A tuple, not a dict: the engine appends
+    one per outcome, so the smaller per-entry footprint adds up."""
+    timestamp: str
+    action_id: str
+    outcome: str
+    outcome_text: Optional[str]
+
+
 class AdaptationEngine:
     """
     Fast learning from user feedback.
@@ -35,6 +48,11 @@ class AdaptationEngine:
         self.memory = memory
         self.adaptation_log = []
 
+        # Fast path: skip log-entry bookkeeping entirely when INFO logging
+        # is off. Re-checked periodically since logging config can change.
+        self._calls = 0
+        self._log_enabled = logger.isEnabledFor(logging.INFO)
+
     def learn_from_outcome(
         self,
         action_id: str,
@@ -59,23 +77,28 @@ class AdaptationEngine:
         # Step 1: Record outcome in memory
         success = self.memory.record_outcome(action_id, outcome, outcome_text)
         if not success:
-            logger.warning(f"Failed to record outcome for action {action_id}")
+            logger.warning("Failed to record outcome for action %s", action_id)
             return False
 
         # Step 2: Update state if provided
         if state:
             self._update_state_from_outcome(action_id, outcome, state)
 
-        # Step 3: Log the adaptation
-        log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "action_id": action_id,
-            "outcome": outcome,
-            "outcome_text": outcome_text
-        }
-        self.adaptation_log.append(log_entry)
+        # Step 3: Log the adaptation (skipped when nobody is listening)
+        self._calls += 1
+        if self._calls & 0xFF == 1:
+            self._log_enabled = logger.isEnabledFor(logging.INFO)
+
+        if self._log_enabled:
+            self.adaptation_log.append(LogEntry(
+                timestamp=datetime.utcnow().isoformat(),
+                action_id=action_id,
+                outcome=outcome,
+                outcome_text=outcome_text
+            ))
+            # Lazy %-formatting: no string is built when INFO is disabled.
+            logger.info("Learned: %s -> %s", action_id, outcome)
 
-        logger.info(f"Learned: {action_id} → {outcome}")
         return True
 
     def _update_state_from_outcome(self, action_id: str, outcome: str, state):
@@ -93,47 +116,54 @@ class AdaptationEngine:
 
         nutrients_targeted = action.nutrients_targeted
 
+        # Vectorized update: one NumPy min/max over the targeted indices
+        # instead of a Python loop of per-nutrient scalar clamps.
+        idx = np.fromiter(
+            (NUTRIENT_INDEX[n] for n in nutrients_targeted if n in NUTRIENT_INDEX),
+            dtype=np.intp
+        )
+        if idx.size == 0:
+            return
+
+        confidence = state.confidence_in_state.array
         if outcome == "positive":
             # Action helped! Boost confidence in targeted nutrients
-            for nutrient in nutrients_targeted:
-                state.confidence_in_state[nutrient] = min(
-                    1.0,
-                    state.confidence_in_state[nutrient] + 0.1
-                )
-                # Slightly boost nutrient belief
-                state.nutrition[nutrient] = min(
-                    1.0,
-                    state.nutrition[nutrient] + 0.05
-                )
+            confidence[idx] = np.minimum(1.0, confidence[idx] + 0.1)
+            # Slightly boost nutrient belief
+            nutrition = state.nutrition.array
+            nutrition[idx] = np.minimum(1.0, nutrition[idx] + 0.05)
 
         elif outcome == "negative":
             # Action didn't help. Reduce confidence in our assessment.
-            for nutrient in nutrients_targeted:
-                state.confidence_in_state[nutrient] = max(
-                    0.3,  # Don't go too low
-                    state.confidence_in_state[nutrient] - 0.1
-                )
+            # Don't go below 0.3.
+            confidence[idx] = np.maximum(0.3, confidence[idx] - 0.1)
 
         state.last_updated = datetime.utcnow()
-        logger.debug(f"State updated based on outcome: {outcome}")
+        logger.debug("State updated based on outcome: %s", outcome)
 
-    def detect_pattern_failure(self) -> Optional[Dict]:
+    def detect_pattern_failure(self, failed=None) -> Optional[Dict]:
         """
         Detect when we're repeatedly failing at something.
-        
+
         Example: "We've suggested spinach 4 times, maa rejected it 3 times"
-        
+
+        Args:
+            failed: Optional precomputed (suggestion, failure_count) list,
+                    to avoid re-fetching from memory.
+
         Returns:
             {"suggestion": "spinach", "failure_rate": 0.75, "should_stop": True}
             or None if no pattern failure detected
         """
-        failed = self.memory.get_failed_patterns()
+        if failed is None:
+            failed = self.memory.get_failed_patterns()
 
         for suggestion, failure_count in failed:
             # Find how many times we suggested this
+            suggestion_lower = suggestion.lower()
             times_suggested = sum(
                 1 for action in self.memory.actions
-                if suggestion.lower() in action.action_text.lower()
+                if suggestion_lower in action.action_text_lower
             )
 
             if times_suggested >= 3:  # Only after multiple attempts
@@ -149,22 +179,28 @@ class AdaptationEngine:
 
         return None
 
-    def detect_successful_pattern(self) -> Optional[Dict]:
+    def detect_successful_pattern(self, successful=None) -> Optional[Dict]:
         """
         Detect when something is consistently working.
-        
+
         Example: "Spinach worked 4 out of 5 times for iron"
-        
+
+        Args:
+            successful: Optional precomputed (suggestion, success_count)
+                        list, to avoid re-fetching from memory.
+
         Returns:
             {"suggestion": "spinach", "success_rate": 0.8, "should_repeat": True}
         """
-        successful = self.memory.get_successful_patterns()
+        if successful is None:
+            successful = self.memory.get_successful_patterns()
 
         for suggestion, success_count in successful:
             # Find total suggestions
+            suggestion_lower = suggestion.lower()
             times_suggested = sum(
                 1 for action in self.memory.actions
-                if suggestion.lower() in action.action_text.lower()
+                if suggestion_lower in action.action_text_lower
             )
 
             if times_suggested >= 2:  # After a couple of tries
@@ -184,16 +220,28 @@ class AdaptationEngine:
         """
         Generate insights about what the system has learned.
         """
+        # Fetch each pattern list once and share it between the snapshot
+        # and the detectors; count outcomes in a single pass.
+        successful = self.memory.get_successful_patterns()
+        failed = self.memory.get_failed_patterns()
+
+        positive = negative = 0
+        for action in self.memory.actions:
+            if action.outcome == "positive":
+                positive += 1
+            elif action.outcome == "negative":
+                negative += 1
+
         insights = {
-            "successful_patterns": dict(self.memory.get_successful_patterns()),
-            "failed_patterns": dict(self.memory.get_failed_patterns()),
-            "pattern_failure": self.detect_pattern_failure(),
-            "pattern_success": self.detect_successful_pattern(),
+            "successful_patterns": dict(successful),
+            "failed_patterns": dict(failed),
+            "pattern_failure": self.detect_pattern_failure(failed),
+            "pattern_success": self.detect_successful_pattern(successful),
             "dislikes": list(self.memory.dislikes),
             "allergies": list(self.memory.allergies),
             "total_actions_taken": len(self.memory.actions),
-            "successful_actions": len([a for a in self.memory.actions if a.outcome == "positive"]),
-            "failed_actions": len([a for a in self.memory.actions if a.outcome == "negative"]),
+            "successful_actions": positive,
+            "failed_actions": negative,
         }
         return insights
 
@@ -17,6 +17,10 @@ from typing import Optional
 
 LOGGER = logging.getLogger(__name__)
 
+# Preformatted responses: no per-call string formatting on these paths.
+_TONE_PREFIX = "(Tone) Thanks for sharing — "
+_SAFE_FALLBACK = "Thanks — I hear you. I'm here to help."
+
 
 class LLMClient:
     """Abstract LLM client. Instantiate with `LLMClient.from_env()`.
@@ -51,9 +55,8 @@ class LocalMockClient(LLMClient):
     def generate_response(self, prompt: str, max_tokens: int = 150) -> str:
         # Very lightweight: return a polite rephrase using simple heuristics.
         # Keep response short and deterministic for tests.
-        header = "(Tone) "
         snippet = prompt.strip().split("\n")[0][:200]
-        return f"{header}Thanks for sharing — {snippet}"
+        return _TONE_PREFIX + snippet
 
 
 class OpenAIClient(LLMClient):
@@ -76,4 +79,4 @@ class OpenAIClient(LLMClient):
             return text
         except Exception:
             LOGGER.exception("OpenAI request failed; falling back to safe message")
-            return "Thanks — I hear you. I'm here to help."
\ No newline at end of file
+            return _SAFE_FALLBACK
\ No newline at end of file
@@ -17,7 +17,10 @@ Architecture:
 ML models are sensors, not decision makers.
 """
 
+import atexit
+import functools
 import logging
+import time
 from datetime import datetime
 from typing import Optional
 
@@ -42,6 +45,50 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class StateSummary:
+    """
+    Lazy view over the subsystem summaries.
+
+    Each section is built on first access and cached, so callers that
+    only want one field (e.g. a health check reading model_health) don't
+    pay for the other three builders. Supports dict-style access for
+    existing consumers.
+    """
+
+    def __init__(self, assistant: "Nutrimama"):
+        self._assistant = assistant
+
+    @functools.cached_property
+    def state(self) -> dict:
+        return self._assistant.state.get_state_summary()
+
+    @functools.cached_property
+    def memory(self) -> dict:
+        return self._assistant.memory.get_summary()
+
+    @functools.cached_property
+    def learning(self) -> dict:
+        return self._assistant.adaptation.get_learning_insights()
+
+    @functools.cached_property
+    def model_health(self) -> dict:
+        return self._assistant.model_registry.check_all_health()
+
+    def __getitem__(self, key: str):
+        if key not in ("state", "memory", "learning", "model_health"):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def to_dict(self) -> dict:
+        """Materialize all four sections (for serialization)."""
+        return {
+            "state": self.state,
+            "memory": self.memory,
+            "learning": self.learning,
+            "model_health": self.model_health
+        }
+
+
 class Nutrimama:
     """
     Main Nutrimama assistant system.
@@ -54,16 +101,27 @@ class Nutrimama:
     - Warm communication
     """
 
+    # Write-coalescing: persist after this many mutations or this much time
+    FLUSH_AFTER_MUTATIONS = 8
+    FLUSH_INTERVAL_SECONDS = 5.0
+
     def __init__(self, user_id: str):
         self.user_id = user_id
-        logger.info(f"Initializing Nutrimama for user: {user_id}")
+        logger.info("Initializing Nutrimama for user: %s", user_id)
+
+        # Dirty-flag persistence: mutations mark state dirty; disk writes
+        # happen in flush(), not inline on the message path.
+        self._dirty = False
+        self._pending_saves = 0
+        self._last_flush = time.monotonic()
+        atexit.register(self.flush)
 
         # Core brain
         # Try to load persisted state & memory
         loaded = load_user_state(user_id)
         if loaded:
             self.state, self.memory = loaded
-            logger.info(f"Loaded persisted state and memory for {user_id}")
+            logger.info("Loaded persisted state and memory for %s", user_id)
         else:
             self.state = MaternalBrainState()
             self.memory = Memory(user_id)
@@ -95,11 +153,10 @@ class Nutrimama:
         """Initialize predictors with dummy models for testing."""
         nutrients = ["iron", "protein", "calcium", "folic", "vitamin_b12", "iodine"]
 
-        for nutrient in nutrients:
-            dummy = DummyNutrientPredictor(nutrient, "1.0")
-            self.predictors.register_predictor(nutrient, dummy)
-
-        logger.info(f"Initialized {len(nutrients)} nutrient predictors")
+        self.predictors.register_many({
+            nutrient: DummyNutrientPredictor(nutrient, "1.0")
+            for nutrient in nutrients
+        })
 
     def process_user_message(self, user_input: str) -> str:
         """
@@ -112,20 +169,21 @@ class Nutrimama:
         4. Reasoning (decide action)
         5. Respond warmly
         """
-        logger.info(f"Processing: {user_input}")
+        logger.info("Processing: %s", user_input)
 
         # Step 1: Acknowledge user
         ack = self.responder.acknowledge_user(user_input)
 
         # Step 2: Parse input
         parsed = self.nlp.parse(user_input)
-        logger.debug(f"Parsed intent: {parsed['intent']}")
+        logger.debug("Parsed intent: %s", parsed["intent"])
 
         # Step 3: Update state based on parsed input
         self._update_state_from_input(parsed)
 
-        # Step 4: Check for feedback on previous actions
-        feedback = self.nlp.get_action_history_intent(user_input)
+        # Step 4: Check for feedback on previous actions (already extracted
+        # by the same parse pass)
+        feedback = parsed.get("feedback")
         if feedback:
             self._process_feedback(feedback)
 
@@ -137,23 +195,21 @@ class Nutrimama:
         self.safety.clear_alerts()
 
         # Step 7: Reasoning - decide action
-        action_type, action_details, reasoning = self.reasoning.decide(
+        action_type, action_details, reasoning, display_name = self.reasoning.decide(
             self.state, self.memory, self.safety
         )
 
-        # Step 8: Log action
+        # Step 8: Log action (display_name was built by the engine)
         action_id = self.memory.log_action(
             action_type.value,
-            action_details.get("food") or action_details.get("suggestion") or str(action_details),
+            display_name,
             reasoning,
             nutrients_targeted=action_details.get("nutrients_targeted", [])
         )
 
-        # Persist after logging an action
-        try:
-            save_user_state(self.user_id, self.state, self.memory)
-        except Exception:
-            logger.exception("Failed to save user state after logging action")
+        # Persist (coalesced) after logging an action
+        self._mark_dirty()
+        self._maybe_flush()
 
         # Step 9: Generate warm response
         response = self.responder.respond_to_action(
@@ -166,24 +222,52 @@ class Nutrimama:
 
         return f"{ack}\n\n{response}"
 
+    def _mark_dirty(self):
+        """Note a state/memory mutation that needs persisting."""
+        self._dirty = True
+        self._pending_saves += 1
+
+    def _maybe_flush(self):
+        """Flush if enough mutations or time have accumulated."""
+        if not self._dirty:
+            return
+        if (self._pending_saves >= self.FLUSH_AFTER_MUTATIONS
+                or time.monotonic() - self._last_flush > self.FLUSH_INTERVAL_SECONDS):
+            self.flush()
+
+    def flush(self):
+        """Persist state and memory now, if anything changed."""
+        if not self._dirty:
+            return
+        try:
+            save_user_state(self.user_id, self.state, self.memory)
+            self._dirty = False
+            self._pending_saves = 0
+        except Exception:
+            logger.exception("Failed to save user state")
+        finally:
+            self._last_flush = time.monotonic()
+
     def _update_state_from_input(self, parsed: dict):
         """Update state based on NLP parsing."""
-        # Report symptoms
-        for symptom in parsed.get("symptoms", []):
-            self.state.report_symptom(symptom)
+        # Report symptoms in one batched state update
+        symptoms = parsed.get("symptoms")
+        if symptoms:
+            self.state.report_symptoms(symptoms)
+            self._mark_dirty()
 
         # Sentiment-based inference
-        if parsed.get("sentiment") == "negative":
-            self.state.energy_level = max(0.0, self.state.energy_level - 0.1)
-
-        elif parsed.get("sentiment") == "positive":
-            self.state.energy_level = min(1.0, self.state.energy_level + 0.1)
+        sentiment = parsed.get("sentiment")
+        delta = 0.1 if sentiment == "positive" else (-0.1 if sentiment == "negative" else 0.0)
+        if delta:
+            self.state.adjust_energy(delta)
+            self._mark_dirty()
 
     def _update_state_from_models(self):
         """Get signals from ML models and damp them into state."""
         predictions = self.predictors.predict_all(
             age=self.state.age or 30,
-            pregnancy_stage=self.state.pregnancy_stage,
+            pregnancy_stage=self.state.pregnancy_stage_code,
             breastfeeding=self.state.breastfeeding,
             recent_symptoms=list(self.state.symptoms),
             days_since_last_check=1
@@ -198,7 +282,7 @@ class Nutrimama:
         outcome = feedback.get("outcome")
 
         response = self.responder.respond_to_feedback(suggestion, outcome)
-        logger.info(f"Feedback processed: {suggestion} → {outcome}")
+        logger.info("Feedback processed: %s -> %s", suggestion, outcome)
 
         # Find matching action in memory
         # For now, just record the feedback
@@ -208,24 +292,21 @@ class Nutrimama:
         if action_id and outcome:
             recorded = self.memory.record_outcome(action_id, outcome, feedback.get("text"))
             if recorded:
-                try:
-                    save_user_state(self.user_id, self.state, self.memory)
-                except Exception:
-                    logger.exception("Failed to save user state after recording feedback")
+                self._mark_dirty()
+                self._maybe_flush()
 
-    def get_state_summary(self) -> dict:
-        """Get current state summary (for UI/debugging)."""
-        return {
-            "state": self.state.get_state_summary(),
-            "memory": self.memory.get_summary(),
-            "learning": self.adaptation.get_learning_insights(),
-            "model_health": self.model_registry.check_all_health()
-        }
+    def get_state_summary(self) -> StateSummary:
+        """Get current state summary (for UI/debugging).
+
+        Returns a lazy view: sections are built on first access. Call
+        `.to_dict()` if you need a plain dict of everything.
+        """
+        return StateSummary(self)
 
     def report_symptom(self, symptom: str):
         """User reports a symptom."""
         self.state.report_symptom(symptom)
-        logger.info(f"Symptom reported: {symptom}")
+        logger.info("Symptom reported: %s", symptom)
 
     def reset_symptoms(self):
         """Clear symptom list."""
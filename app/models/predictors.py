@@ -12,11 +12,66 @@ This file wraps CatBoost and other models.
 Models live in models/registry.py
 """
 
-from typing import Dict, Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 import logging
+import threading
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# NumPy Generators are not safe for concurrent use; keep one per thread
+# so parallel user sessions don't share RNG state.
+_TLS = threading.local()
+
+
+def _thread_rng() -> np.random.Generator:
+    rng = getattr(_TLS, "rng", None)
+    if rng is None:
+        rng = _TLS.rng = np.random.default_rng()
+    return rng
+
+def _confidence_kernel(prediction: float, accuracy: float) -> float:
+    """Scalar confidence math, kept at module level so it can be JIT
+    compiled. Predictions near 0.5 are uncertain; near 0 or 1 certain."""
+    confidence = abs(prediction - 0.5) * 2.0
+    if confidence > 1.0:
+        confidence = 1.0
+    return confidence * accuracy
+
+
+try:
+    # Optional: JIT the per-prediction kernel when numba is installed.
+    # Pure-Python fallback keeps the package dependency-light.
+    from numba import njit
+
+    _confidence_kernel = njit(cache=True)(_confidence_kernel)
+except Exception:  # pragma: no cover - numba is optional
+    pass
+
+
+# Pregnancy stage -> numeric feature code (kept for string callers;
+# hot paths pass state.pregnancy_stage_code and skip the lookup)
+PREGNANCY_MAP = {
+    None: 0,
+    "planning": 1,
+    "first_trimester": 2,
+    "second_trimester": 3,
+    "third_trimester": 4,
+}
+
+# Accepted everywhere a stage feature is built: the stage string, the
+# precomputed int code from MaternalBrainState, or None.
+StageLike = Union[int, str, None]
+
+
+def _stage_code(pregnancy_stage: StageLike) -> int:
+    """Resolve a stage to its int feature code (no-op for int callers)."""
+    if isinstance(pregnancy_stage, int):
+        return pregnancy_stage
+    return PREGNANCY_MAP.get(pregnancy_stage, 0)
+
 
 class NutrientPredictor:
     """
@@ -30,11 +85,16 @@ class NutrientPredictor:
         self.model = None  # Will be loaded from registry
         self.accuracy = 0.0
         self.last_used = None
+        # Reused (1, F) feature buffer: no per-call list allocations and
+        # backends get a contiguous array instead of a list-of-lists.
+        # Per-instance, so concurrent threads must use separate predictors
+        # (the suite's RNG is thread-local for the same reason).
+        self._feat_buf = np.empty((1, 5), dtype=np.float32)
 
     def predict(
         self,
         age: int,
-        pregnancy_stage: Optional[str],
+        pregnancy_stage: StageLike,
         breastfeeding: bool,
         recent_symptoms: list,
         days_since_last_check: int,
@@ -60,7 +120,7 @@ class NutrientPredictor:
             confidence: 0-1 float (model's confidence in this prediction)
         """
         if self.model is None:
-            logger.warning(f"Model {self.model_name} not loaded. Returning neutral signal.")
+            logger.warning("Model %s not loaded. Returning neutral signal.", self.model_name)
             return 0.5, 0.0
 
         try:
@@ -75,51 +135,51 @@ class NutrientPredictor:
             # Get confidence (from model's probability if available, else use accuracy)
             confidence = self._estimate_confidence(raw_prediction)
 
-            logger.debug(
-                f"{self.model_name}: prediction={raw_prediction:.2f}, "
-                f"confidence={confidence:.2f}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "%s: prediction=%.2f, confidence=%.2f",
+                    self.model_name, raw_prediction, confidence
+                )
 
             return float(raw_prediction), float(confidence)
 
         except Exception as e:
-            logger.error(f"Prediction error in {self.model_name}: {e}")
+            logger.error("Prediction error in %s: %s", self.model_name, e)
             return 0.5, 0.0
 
     def _prepare_features(
         self,
         age: int,
-        pregnancy_stage: Optional[str],
+        pregnancy_stage: StageLike,
         breastfeeding: bool,
         recent_symptoms: list,
         days_since_last_check: int,
         **kwargs
-    ) -> list:
+    ) -> np.ndarray:
         """
         Convert user data into model input features.
         This is data preprocessing, not state management.
+
+        Returns a (1, F) array suitable for sklearn-like `predict` APIs.
+        The buffer is reused across calls, so callers must not hold a
+        reference past the next predict.
         """
-        # Map pregnancy stage to numeric
-        pregnancy_map = {
-            None: 0,
-            "planning": 1,
-            "first_trimester": 2,
-            "second_trimester": 3,
-            "third_trimester": 4,
-        }
-
-        features = [
-            age,
-            pregnancy_map.get(pregnancy_stage, 0),
-            1 if breastfeeding else 0,
-            len(recent_symptoms),  # Number of symptoms
-            days_since_last_check,
-        ]
+        n_features = 5 + len(kwargs)
+        buf = self._feat_buf
+        if buf.shape[1] != n_features:
+            buf = self._feat_buf = np.empty((1, n_features), dtype=np.float32)
+
+        buf[0, 0] = age
+        buf[0, 1] = _stage_code(pregnancy_stage)
+        buf[0, 2] = 1 if breastfeeding else 0
+        buf[0, 3] = len(recent_symptoms)  # Number of symptoms
+        buf[0, 4] = days_since_last_check
 
         # Add any additional kwargs as features
-        features.extend(kwargs.values())
+        for i, value in enumerate(kwargs.values(), start=5):
+            buf[0, i] = value
 
-        return [features]  # Wrap in list for sklearn-like API
+        return buf
 
     def _estimate_confidence(self, prediction: float) -> float:
         """
@@ -129,19 +189,25 @@ class NutrientPredictor:
         - Predictions near 0.5 = uncertain
         - Predictions near 0 or 1 = certain
         """
-        distance_from_neutral = abs(prediction - 0.5)
-        confidence = min(1.0, distance_from_neutral * 2)
-        
-        # Multiply by model's accuracy
-        confidence *= self.accuracy
-        
-        return confidence
+        return _confidence_kernel(prediction, self.accuracy)
+
+    def predict_batch(self, features: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized prediction over a (n_rows, n_features) matrix.
+
+        Backends that can answer a whole suite in one call override this;
+        the base class has no batch path.
+
+        Returns:
+            (predictions, confidences) as float arrays of length n_rows
+        """
+        raise NotImplementedError
 
     def load_model(self, model_obj, accuracy: float):
         """Load a trained model."""
         self.model = model_obj
         self.accuracy = accuracy
-        logger.info(f"Loaded {self.model_name} v{self.model_version} (accuracy: {accuracy:.2f})")
+        logger.info("Loaded %s v%s (accuracy: %.2f)", self.model_name, self.model_version, accuracy)
 
     def __repr__(self) -> str:
         status = "loaded" if self.model else "not_loaded"
@@ -155,12 +221,18 @@ class DummyNutrientPredictor(NutrientPredictor):
 
     def predict(self, **kwargs) -> Tuple[float, float]:
         """Return neutral signal for testing."""
-        import random
         # Random signal between 0.3 and 0.7 (stays in middle range)
-        prediction = 0.3 + random.random() * 0.4
+        prediction = float(_thread_rng().uniform(0.3, 0.7))
         confidence = 0.5
         return prediction, confidence
 
+    def predict_batch(self, features: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """One vectorized RNG call covers every row."""
+        n = len(features)
+        predictions = _thread_rng().uniform(0.3, 0.7, size=n)
+        confidences = np.full(n, 0.5)
+        return predictions, confidences
+
 
 class PredictorSuite:
     """
@@ -168,18 +240,59 @@ class PredictorSuite:
     Manages model versioning and fallbacks.
     """
 
+    # Bounded memoization of predict_all (LRU, exact-match keys)
+    CACHE_MAX_ENTRIES = 128
+
     def __init__(self):
         self.predictors: Dict[str, NutrientPredictor] = {}
+        # Parallel name list so batch results zip back without dict iteration
+        self._nutrient_names: List[str] = []
+        # Single predictor that can batch-answer the whole suite, or None
+        self._batch_predictor: Optional[NutrientPredictor] = None
+        # predict_all inputs rarely change between consecutive chat turns;
+        # cache results keyed on the exact input tuple.
+        self._pred_cache: OrderedDict = OrderedDict()
 
     def register_predictor(self, nutrient: str, predictor: NutrientPredictor):
         """Register a predictor for a nutrient."""
         self.predictors[nutrient] = predictor
-        logger.info(f"Registered predictor for {nutrient}: {predictor}")
+        self._nutrient_names = list(self.predictors.keys())
+        self._batch_predictor = self._find_batch_predictor()
+        self.invalidate_cache()
+        logger.info("Registered predictor for %s: %s", nutrient, predictor)
+
+    def register_many(self, predictors: Mapping[str, NutrientPredictor]) -> None:
+        """Register several predictors in one shot: one dict update, one
+        bookkeeping pass, one summary log line."""
+        self.predictors.update(predictors)
+        self._nutrient_names = list(self.predictors.keys())
+        self._batch_predictor = self._find_batch_predictor()
+        self.invalidate_cache()
+        logger.info("Registered %d predictors: %s", len(predictors), list(predictors))
+
+    def invalidate_cache(self):
+        """Drop memoized predictions. Call after swapping or reloading
+        models on registered predictors."""
+        self._pred_cache.clear()
+
+    def _find_batch_predictor(self) -> Optional[NutrientPredictor]:
+        """
+        A single vectorized call can replace the per-nutrient loop only
+        when every registered predictor is the same class and that class
+        overrides predict_batch.
+        """
+        kinds = {type(p) for p in self.predictors.values()}
+        if len(kinds) != 1:
+            return None
+        kind = kinds.pop()
+        if kind.predict_batch is NutrientPredictor.predict_batch:
+            return None
+        return next(iter(self.predictors.values()))
 
     def predict_all(
         self,
         age: int,
-        pregnancy_stage: Optional[str],
+        pregnancy_stage: StageLike,
         breastfeeding: bool,
         recent_symptoms: list,
         days_since_last_check: int
@@ -194,8 +307,59 @@ class PredictorSuite:
                 ...
             }
         """
-        results = {}
+        names = self._nutrient_names
+        if not names:
+            return {}
+
+        # Memoize on the exact input tuple: repeated turns with unchanged
+        # context skip the predictor pass entirely.
+        cache_key = (
+            age,
+            pregnancy_stage,
+            breastfeeding,
+            tuple(sorted(recent_symptoms)),
+            days_since_last_check,
+        )
+        cached = self._pred_cache.get(cache_key)
+        if cached is not None:
+            self._pred_cache.move_to_end(cache_key)
+            return cached
 
+        results = self._predict_all_uncached(
+            age, pregnancy_stage, breastfeeding, recent_symptoms, days_since_last_check
+        )
+
+        self._pred_cache[cache_key] = results
+        if len(self._pred_cache) > self.CACHE_MAX_ENTRIES:
+            self._pred_cache.popitem(last=False)
+
+        return results
+
+    def _predict_all_uncached(
+        self,
+        age: int,
+        pregnancy_stage: StageLike,
+        breastfeeding: bool,
+        recent_symptoms: list,
+        days_since_last_check: int
+    ) -> Dict[str, Tuple[float, float]]:
+        names = self._nutrient_names
+
+        # Fast path: one vectorized call instead of O(nutrients) Python calls
+        if self._batch_predictor is not None:
+            feature_row = np.array([
+                age,
+                _stage_code(pregnancy_stage),
+                1 if breastfeeding else 0,
+                len(recent_symptoms),
+                days_since_last_check,
+            ], dtype=np.float64)
+            features = np.broadcast_to(feature_row, (len(names), feature_row.size))
+            predictions, confidences = self._batch_predictor.predict_batch(features)
+            return dict(zip(names, zip(predictions.tolist(), confidences.tolist())))
+
+        # Mixed suite: fall back to per-predictor scalar calls
+        results = {}
         for nutrient, predictor in self.predictors.items():
             prediction, confidence = predictor.predict(
                 age=age,
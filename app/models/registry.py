@@ -9,7 +9,7 @@ Tracks:
 - When models need retraining
 """
 
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 import logging
@@ -17,9 +17,13 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelMetadata:
-    """Metadata about a trained model."""
+    """Metadata about a trained model.
+
+    Slotted: a registry holds one instance per (nutrient, version), so
+    dropping the per-instance __dict__ roughly halves its footprint.
+    """
     name: str  # e.g., "iron_predictor"
     version: str  # e.g., "1.0", "1.1"
     nutrient: str  # Which nutrient does it predict?
@@ -47,20 +51,24 @@ class ModelMetadata:
     # Notes
     notes: str = ""
 
-    def days_since_training(self) -> int:
-        """How many days since this model was trained?"""
-        return (datetime.utcnow() - self.training_date).days
+    def days_since_training(self, *, now: Optional[datetime] = None) -> int:
+        """How many days since this model was trained?
+
+        Pass `now` when checking many models in one sweep so they all
+        share a single clock read.
+        """
+        return ((now or datetime.utcnow()) - self.training_date).days
 
-    def days_since_deployment(self) -> int:
+    def days_since_deployment(self, *, now: Optional[datetime] = None) -> int:
         """How many days since deployed?"""
         if not self.deployment_date:
             return 0
-        return (datetime.utcnow() - self.deployment_date).days
+        return ((now or datetime.utcnow()) - self.deployment_date).days
 
-    def should_retrain(self, max_days: int = 90) -> bool:
+    def should_retrain(self, max_days: int = 90, *, now: Optional[datetime] = None) -> bool:
         """
         Should this model be retrained?
-        
+
         Reasons to retrain:
         - Hasn't been trained in 90 days
         - Drift detected
@@ -73,7 +81,7 @@ class ModelMetadata:
         if self.drift_detected:
             return True
 
-        if self.days_since_training() > max_days:
+        if self.days_since_training(now=now) > max_days:
             return True
 
         return False
@@ -85,57 +93,91 @@ class ModelRegistry:
     """
 
     def __init__(self):
-        self.models: Dict[str, List[ModelMetadata]] = {}  # nutrient -> [versions]
+        # nutrient -> {version -> metadata}: O(1) version lookup
+        self.models: Dict[str, Dict[str, ModelMetadata]] = {}
         self.deployed_versions: Dict[str, str] = {}  # nutrient -> deployed_version
 
+        # Deployed metadata + health buckets, maintained incrementally at
+        # mutation time so check_all_health never walks the registry.
+        self._deployed_meta: Dict[str, ModelMetadata] = {}
+        self._deployed_labels: Dict[str, str] = {}  # nutrient -> "nutrient vX"
+        self._latest_by_nutrient: Dict[str, ModelMetadata] = {}
+        self._healthy: set = set()
+        self._needs_retraining: set = set()
+        self._drift: set = set()
+        self._unhealthy: set = set()
+        self._total_versions = 0  # maintained in register(): O(1) stats
+
     def register(self, metadata: ModelMetadata):
         """Register a new model version."""
-        if metadata.nutrient not in self.models:
-            self.models[metadata.nutrient] = []
+        versions = self.models.setdefault(metadata.nutrient, {})
+        if metadata.version not in versions:
+            self._total_versions += 1
+        versions[metadata.version] = metadata
+
+        # Track the newest training date as versions arrive: O(1) lookup later
+        latest = self._latest_by_nutrient.get(metadata.nutrient)
+        if latest is None or metadata.training_date > latest.training_date:
+            self._latest_by_nutrient[metadata.nutrient] = metadata
 
-        self.models[metadata.nutrient].append(metadata)
-        
         if metadata.is_deployed:
             self.deployed_versions[metadata.nutrient] = metadata.version
+            self._deployed_meta[metadata.nutrient] = metadata
+            self._reclassify(metadata.nutrient)
 
         logger.info(
             f"Registered {metadata.nutrient} v{metadata.version} "
             f"(accuracy: {metadata.accuracy:.2f})"
         )
 
+    def _reclassify(self, nutrient: str):
+        """Re-bucket the deployed model for this nutrient after a flag change."""
+        old_label = self._deployed_labels.pop(nutrient, None)
+        if old_label is not None:
+            self._healthy.discard(old_label)
+            self._needs_retraining.discard(old_label)
+            self._drift.discard(old_label)
+            self._unhealthy.discard(old_label)
+
+        model = self._deployed_meta.get(nutrient)
+        if not model:
+            return
+
+        label = f"{nutrient} v{model.version}"
+        self._deployed_labels[nutrient] = label
+
+        if model.drift_detected:
+            self._drift.add(label)
+        elif model.needs_retraining:
+            self._needs_retraining.add(label)
+        elif not model.is_healthy:
+            self._unhealthy.add(label)
+        else:
+            self._healthy.add(label)
+
     def get_deployed_version(self, nutrient: str) -> Optional[ModelMetadata]:
         """Get the currently deployed model for a nutrient."""
-        if nutrient not in self.deployed_versions:
-            return None
-
-        version = self.deployed_versions[nutrient]
-        return self.get_version(nutrient, version)
+        return self._deployed_meta.get(nutrient)
 
     def get_version(self, nutrient: str, version: str) -> Optional[ModelMetadata]:
         """Get specific version of a model."""
-        if nutrient not in self.models:
-            return None
-
-        for model in self.models[nutrient]:
-            if model.version == version:
-                return model
-
-        return None
+        return self.models.get(nutrient, {}).get(version)
 
     def get_latest_version(self, nutrient: str) -> Optional[ModelMetadata]:
         """Get latest version (not necessarily deployed)."""
+        latest = self._latest_by_nutrient.get(nutrient)
+        if latest is not None:
+            return latest
+
         if nutrient not in self.models:
             return None
 
-        return sorted(
-            self.models[nutrient],
-            key=lambda m: m.training_date,
-            reverse=True
-        )[0]
+        # Fallback: linear max scan (no sort, no list copy)
+        return max(self.models[nutrient].values(), key=lambda m: m.training_date)
 
     def list_versions(self, nutrient: str) -> List[ModelMetadata]:
         """List all versions of a nutrient predictor."""
-        return self.models.get(nutrient, [])
+        return list(self.models.get(nutrient, {}).values())
 
     def deploy_version(self, nutrient: str, version: str) -> bool:
         """
@@ -162,6 +204,8 @@ class ModelRegistry:
         model.is_deployed = True
         model.deployment_date = datetime.utcnow()
         self.deployed_versions[nutrient] = version
+        self._deployed_meta[nutrient] = model
+        self._reclassify(nutrient)
 
         logger.info(f"Deployed {nutrient} v{version}")
         return True
@@ -172,6 +216,8 @@ class ModelRegistry:
         if model:
             model.needs_retraining = True
             model.notes += f"\nFlagged for retraining: {reason}"
+            if self._deployed_meta.get(nutrient) is model:
+                self._reclassify(nutrient)
             logger.warning(f"Marked {nutrient} v{version} for retraining: {reason}")
 
     def detect_drift(self, nutrient: str, version: str):
@@ -179,12 +225,28 @@ class ModelRegistry:
         model = self.get_version(nutrient, version)
         if model:
             model.drift_detected = True
+            if self._deployed_meta.get(nutrient) is model:
+                self._reclassify(nutrient)
             logger.warning(f"Drift detected in {nutrient} v{version}")
 
+    def mark_healthy(self, nutrient: str, version: str):
+        """Clear health flags (e.g. after retraining or drift resolution)."""
+        model = self.get_version(nutrient, version)
+        if model:
+            model.is_healthy = True
+            model.drift_detected = False
+            model.needs_retraining = False
+            if self._deployed_meta.get(nutrient) is model:
+                self._reclassify(nutrient)
+            logger.info(f"Marked {nutrient} v{version} healthy")
+
     def check_all_health(self) -> Dict:
         """
         Check health of all deployed models.
-        
+
+        The buckets are maintained incrementally as flags change, so this
+        is a snapshot, not a registry walk.
+
         Returns:
             {
                 "healthy": [...],
@@ -193,34 +255,20 @@ class ModelRegistry:
                 "unhealthy": [...]
             }
         """
-        health_report = {
-            "healthy": [],
-            "needs_retraining": [],
-            "drift_detected": [],
-            "unhealthy": []
+        return {
+            "healthy": sorted(self._healthy),
+            "needs_retraining": sorted(self._needs_retraining),
+            "drift_detected": sorted(self._drift),
+            "unhealthy": sorted(self._unhealthy)
         }
 
-        for nutrient, version in self.deployed_versions.items():
-            model = self.get_deployed_version(nutrient)
-            if not model:
-                continue
-
-            if model.drift_detected:
-                health_report["drift_detected"].append(f"{nutrient} v{version}")
-            elif model.needs_retraining:
-                health_report["needs_retraining"].append(f"{nutrient} v{version}")
-            elif not model.is_healthy:
-                health_report["unhealthy"].append(f"{nutrient} v{version}")
-            else:
-                health_report["healthy"].append(f"{nutrient} v{version}")
-
-        return health_report
+    def _counts(self) -> Tuple[int, int, int]:
+        """(nutrients, versions, deployed) — three O(1) reads, no copies."""
+        return len(self.models), self._total_versions, len(self.deployed_versions)
 
     def get_stats(self) -> Dict:
-        """Get registry statistics."""
-        total_models = sum(len(versions) for versions in self.models.values())
-        total_nutrients = len(self.models)
-        deployed = len(self.deployed_versions)
+        """Get registry statistics (full snapshot, copies the deployment map)."""
+        total_nutrients, total_models, deployed = self._counts()
 
         return {
             "total_nutrients_tracked": total_nutrients,
@@ -231,9 +279,9 @@ class ModelRegistry:
         }
 
     def __repr__(self) -> str:
-        stats = self.get_stats()
+        nutrients, versions, deployed = self._counts()
         return (
-            f"ModelRegistry({stats['total_nutrients_tracked']} nutrients, "
-            f"{stats['total_model_versions']} versions, "
-            f"{stats['currently_deployed']} deployed)"
+            f"ModelRegistry({nutrients} nutrients, "
+            f"{versions} versions, "
+            f"{deployed} deployed)"
         )
@@ -8,13 +8,54 @@ import os
 import io
 import json
 import logging
+import threading
+import time
 
 LOGGER = logging.getLogger(__name__)
 
+# MSAL app/token caches: rebuilding PublicClientApplication and re-parsing
+# the token cache file per call is pure overhead for frequent backups.
+_APP_LOCK = threading.Lock()
+_APP_CACHE: dict = {}  # (client_id, cache_path) -> (app, cache, mtime)
+_TOKEN_CACHE: dict = {}  # (client_id, cache_path) -> (access_token, expires_at)
+_TOKEN_REFRESH_MARGIN_S = 60.0
+
+# One shared HTTP session: connection pooling (no TLS handshake per call)
+# plus automatic retry with backoff on transient Graph errors.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session():
+    """Return the shared `requests.Session`, building it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                retry = Retry(
+                    total=5,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                )
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(max_retries=retry))
+                _SESSION = session
+    return _SESSION
+
 # Graph endpoints
 GRAPH_UPLOAD_URL = "https://graph.microsoft.com/v1.0/me/drive/root:/{}:/content"
+GRAPH_CREATE_UPLOAD_SESSION = "https://graph.microsoft.com/v1.0/me/drive/root:/{}:/createUploadSession"
 GRAPH_DOWNLOAD_BY_ID = "https://graph.microsoft.com/v1.0/me/drive/items/{}/content"
 
+# Backups above this size go through a resumable upload session instead of
+# one buffered PUT. Chunk size must be a multiple of 320 KiB per Graph docs.
+SIMPLE_UPLOAD_MAX_BYTES = 4 * 1024 * 1024
+UPLOAD_CHUNK_BYTES = 10 * 1024 * 1024
+
 
 def authorize_device_flow(client_id: str, cache_path: str, scopes=None, authority: str = "https://login.microsoftonline.com/common") -> None:
     """Run device-code flow and store token cache to `cache_path`.
@@ -58,14 +99,62 @@ def _load_app_from_cache(client_id: str, cache_path: str, authority: str = "http
         LOGGER.exception("MSAL not installed")
         raise
 
+    key = (client_id, cache_path)
+    mtime = os.path.getmtime(cache_path) if os.path.exists(cache_path) else 0.0
+
+    with _APP_LOCK:
+        entry = _APP_CACHE.get(key)
+        if entry is not None and entry[2] == mtime:
+            return entry[0], entry[1]
+
     cache = msal.SerializableTokenCache()
     if os.path.exists(cache_path):
         cache.deserialize(open(cache_path, "r", encoding="utf-8").read())
 
     app = msal.PublicClientApplication(client_id, authority=authority, token_cache=cache)
+
+    with _APP_LOCK:
+        _APP_CACHE[key] = (app, cache, mtime)
+        _TOKEN_CACHE.pop(key, None)
+
     return app, cache
 
 
+def _acquire_token(app, cache, client_id: str, cache_path: str, scopes) -> Optional[dict]:
+    """Silent token acquisition with an expiry-aware in-process cache."""
+    key = (client_id, cache_path)
+
+    with _APP_LOCK:
+        cached = _TOKEN_CACHE.get(key)
+        if cached is not None and time.monotonic() < cached[1]:
+            return {"access_token": cached[0]}
+
+    accounts = app.get_accounts()
+    result = None
+    if accounts:
+        result = app.acquire_token_silent(scopes, account=accounts[0])
+
+    if result and result.get("access_token"):
+        expires_in = float(result.get("expires_in") or 0)
+        with _APP_LOCK:
+            _TOKEN_CACHE[key] = (
+                result["access_token"],
+                time.monotonic() + max(0.0, expires_in - _TOKEN_REFRESH_MARGIN_S),
+            )
+
+        # Persist refreshed MSAL state only when it actually changed
+        if cache is not None and getattr(cache, "has_state_changed", False):
+            try:
+                with open(cache_path, "w", encoding="utf-8") as f:
+                    f.write(cache.serialize())
+                with _APP_LOCK:
+                    _APP_CACHE[key] = (app, cache, os.path.getmtime(cache_path))
+            except Exception:
+                LOGGER.exception("Failed to persist MSAL token cache")
+
+    return result
+
+
 def upload_backup_to_onedrive(user_id: str, client_id: str, cache_path: str, file_name: Optional[str] = None) -> Optional[str]:
     """Upload backup package to the user's OneDrive and return the file id (or None).
 
@@ -80,12 +169,8 @@ def upload_backup_to_onedrive(user_id: str, client_id: str, cache_path: str, fil
 
     app, cache = _load_app_from_cache(client_id, cache_path)
 
-    # Acquire token silently
-    scopes = ["Files.ReadWrite"]
-    accounts = app.get_accounts()
-    result = None
-    if accounts:
-        result = app.acquire_token_silent(scopes, account=accounts[0])
+    # Acquire token silently (cached until near expiry)
+    result = _acquire_token(app, cache, client_id, cache_path, ["Files.ReadWrite"])
 
     if not result:
         LOGGER.info("No valid token in cache; interactive device flow required")
@@ -98,11 +183,18 @@ def upload_backup_to_onedrive(user_id: str, client_id: str, cache_path: str, fil
 
     package = get_backup_bytes_for_mobile(user_id)
     name = file_name or f"nutrimama_{user_id}_backup.json"
-    url = GRAPH_UPLOAD_URL.format(name)
 
+    session = _get_session()
+
+    # Large backups stream through a resumable session: bounded chunks on
+    # the wire and retriable per-chunk instead of one monolithic PUT.
+    if len(package) > SIMPLE_UPLOAD_MAX_BYTES:
+        return _upload_large_to_onedrive(session, access_token, name, package)
+
+    url = GRAPH_UPLOAD_URL.format(name)
     headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
     try:
-        resp = requests.put(url, headers=headers, data=package)
+        resp = session.put(url, headers=headers, data=package)
         resp.raise_for_status()
         data = resp.json()
         file_id = data.get("id") or data.get("name")
@@ -113,6 +205,42 @@ def upload_backup_to_onedrive(user_id: str, client_id: str, cache_path: str, fil
         return None
 
 
+def _upload_large_to_onedrive(session, access_token: str, name: str, package: bytes) -> Optional[str]:
+    """Upload via Graph's createUploadSession with 320 KiB-aligned chunks."""
+    headers = {"Authorization": f"Bearer {access_token}"}
+    try:
+        resp = session.post(
+            GRAPH_CREATE_UPLOAD_SESSION.format(name),
+            headers=headers,
+            json={"item": {"@microsoft.graph.conflictBehavior": "replace"}},
+        )
+        resp.raise_for_status()
+        upload_url = resp.json().get("uploadUrl")
+        if not upload_url:
+            LOGGER.error("createUploadSession returned no uploadUrl")
+            return None
+
+        total = len(package)
+        view = memoryview(package)  # chunk slices without copying
+        data = {}
+        for start in range(0, total, UPLOAD_CHUNK_BYTES):
+            end = min(start + UPLOAD_CHUNK_BYTES, total)
+            chunk_headers = {
+                "Content-Length": str(end - start),
+                "Content-Range": f"bytes {start}-{end - 1}/{total}",
+            }
+            resp = session.put(upload_url, headers=chunk_headers, data=view[start:end])
+            resp.raise_for_status()
+            data = resp.json()
+
+        file_id = data.get("id") or data.get("name")
+        LOGGER.info("Uploaded backup to OneDrive via upload session: %s (id=%s)", name, file_id)
+        return file_id
+    except Exception:
+        LOGGER.exception("Failed resumable upload to OneDrive")
+        return None
+
+
 def download_backup_from_onedrive(file_id: str, client_id: str, cache_path: str) -> Optional[bytes]:
     try:
         import requests
@@ -120,12 +248,8 @@ def download_backup_from_onedrive(file_id: str, client_id: str, cache_path: str)
         LOGGER.exception("Missing requests library")
         raise
 
-    app, _ = _load_app_from_cache(client_id, cache_path)
-    scopes = ["Files.ReadWrite"]
-    accounts = app.get_accounts()
-    result = None
-    if accounts:
-        result = app.acquire_token_silent(scopes, account=accounts[0])
+    app, cache = _load_app_from_cache(client_id, cache_path)
+    result = _acquire_token(app, cache, client_id, cache_path, ["Files.ReadWrite"])
 
     if not result or not result.get("access_token"):
         LOGGER.error("No token available; please authorize first")
@@ -135,7 +259,7 @@ def download_backup_from_onedrive(file_id: str, client_id: str, cache_path: str)
     url = GRAPH_DOWNLOAD_BY_ID.format(file_id)
     headers = {"Authorization": f"Bearer {access_token}"}
     try:
-        resp = requests.get(url, headers=headers, stream=True)
+        resp = _get_session().get(url, headers=headers, stream=True)
         resp.raise_for_status()
         return resp.content
     except Exception:
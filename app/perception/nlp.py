@@ -6,7 +6,7 @@ NOT a full NLP model. Simple pattern matching + keyword extraction.
 Fast, explainable, low-latency.
 """
 
-from typing import Dict, List, Optional, Literal
+from typing import Dict, Final, List, Optional, Literal
 import re
 import logging
 
@@ -34,27 +34,28 @@ class NLPParser:
         "weakness|weak": "weakness"
     }
 
-    # Sentiment indicators
-    POSITIVE_WORDS = {
+    # Sentiment indicators (frozen: immutable, hashable, no accidental
+    # mutation; the hot path uses the precompiled alternations below)
+    POSITIVE_WORDS: Final[frozenset] = frozenset({
         "good", "great", "better", "best", "feeling good", "improved",
         "energetic", "happy", "glad", "thank you", "thanks",
         "working", "helped", "excellent", "wonderful", "nice"
-    }
+    })
 
-    NEGATIVE_WORDS = {
+    NEGATIVE_WORDS: Final[frozenset] = frozenset({
         "bad", "worse", "worst", "not good", "terrible", "awful",
         "upset", "sad", "angry", "frustrated", "didn't help", "useless",
         "hate", "dislike", "can't", "unable", "poor", "horrible"
-    }
+    })
 
     # Nutrient-related keywords
-    NUTRIENT_KEYWORDS = {
-        "iron": ["iron", "spinach", "red meat", "blood", "hemoglobin"],
-        "protein": ["protein", "meat", "chicken", "eggs", "milk", "strong"],
-        "calcium": ["calcium", "milk", "bones", "teeth", "dairy"],
-        "folic": ["folic", "spinach", "vegetables", "greens"],
-        "vitamin_b12": ["b12", "energy", "meat", "eggs"],
-        "iodine": ["iodine", "salt", "thyroid"]
+    NUTRIENT_KEYWORDS: Final[Dict[str, tuple]] = {
+        "iron": ("iron", "spinach", "red meat", "blood", "hemoglobin"),
+        "protein": ("protein", "meat", "chicken", "eggs", "milk", "strong"),
+        "calcium": ("calcium", "milk", "bones", "teeth", "dairy"),
+        "folic": ("folic", "spinach", "vegetables", "greens"),
+        "vitamin_b12": ("b12", "energy", "meat", "eggs"),
+        "iodine": ("iodine", "salt", "thyroid")
     }
 
     def __init__(self):
@@ -71,11 +72,28 @@ class NLPParser:
                 "sentiment": "positive" / "negative" / "neutral",
                 "nutrients_mentioned": [nutrients user talked about],
                 "intent": "report_symptom" / "give_feedback" / "ask_question" / "general_chat",
-                "confidence": 0-1 (how confident are we in this parsing?)
+                "confidence": 0-1 (how confident are we in this parsing?),
+                "feedback": outcome report dict (see get_action_history_intent) or None
             }
         """
         text_lower = user_input.lower().strip()
 
+        # Fast path: a short message that is only a greeting/thanks token
+        # needs no keyword extraction at all.
+        if len(text_lower) < _TRIVIAL_MAX_LEN and _SHORT_TRIVIAL_RE.fullmatch(text_lower):
+            sentiment = self._detect_sentiment(text_lower)
+            result = {
+                "text": user_input,
+                "symptoms": [],
+                "sentiment": sentiment,
+                "nutrients_mentioned": [],
+                "intent": "greeting" if _is_greeting(text_lower) else "general_chat",
+                "confidence": self._calculate_confidence([], sentiment, []),
+                "feedback": None
+            }
+            self.last_parsed = result
+            return result
+
         symptoms = self._extract_symptoms(text_lower)
         sentiment = self._detect_sentiment(text_lower)
         nutrients = self._extract_nutrients(text_lower)
@@ -87,7 +105,9 @@ class NLPParser:
             "sentiment": sentiment,
             "nutrients_mentioned": nutrients,
             "intent": intent,
-            "confidence": self._calculate_confidence(symptoms, sentiment, nutrients)
+            "confidence": self._calculate_confidence(symptoms, sentiment, nutrients),
+            # Extracted in the same pass so callers don't re-scan the text
+            "feedback": self._extract_action_history(text_lower)
         }
 
         self.last_parsed = result
@@ -97,18 +117,23 @@ class NLPParser:
 
     def _extract_symptoms(self, text: str) -> List[str]:
         """Find symptoms in the text."""
-        symptoms = []
-        
-        for pattern, symptom_name in self.SYMPTOM_KEYWORDS.items():
-            if re.search(pattern, text, re.IGNORECASE):
-                symptoms.append(symptom_name)
-        
-        return list(set(symptoms))  # Remove duplicates
+        if _HS_SYMPTOM_DB is not None:
+            found = set()
+
+            def _on_match(pattern_id, start, end, flags, context=None):
+                found.add(_SYMPTOM_NAMES[pattern_id])
+
+            _HS_SYMPTOM_DB.scan(text.encode("utf-8"), match_event_handler=_on_match)
+            return list(found)
+
+        # One pass: each match's lastgroup is the symptom name, and the
+        # set comprehension dedups repeats.
+        return list({m.lastgroup for m in _SYMPTOM_UNION.finditer(text)})
 
     def _detect_sentiment(self, text: str) -> Literal["positive", "negative", "neutral"]:
         """Simple sentiment analysis."""
-        positive_score = sum(1 for word in self.POSITIVE_WORDS if word in text)
-        negative_score = sum(1 for word in self.NEGATIVE_WORDS if word in text)
+        positive_score = sum(1 for _ in _POS_RE.finditer(text))
+        negative_score = sum(1 for _ in _NEG_RE.finditer(text))
 
         if positive_score > negative_score:
             return "positive"
@@ -119,22 +144,20 @@ class NLPParser:
 
     def _extract_nutrients(self, text: str) -> List[str]:
         """Find nutrient mentions in the text (return list of nutrient keys)."""
-        nutrients = []
-
-        for nutrient, keywords in self.NUTRIENT_KEYWORDS.items():
-            for keyword in keywords:
-                if re.search(rf"\b{re.escape(keyword.lower())}\b", text):
-                    nutrients.append(nutrient)
-                    break
-
-        return nutrients
+        return [
+            nutrient for nutrient, pattern in _NUTRIENT_PATTERNS
+            if pattern.search(text)
+        ]
 
     def _detect_intent(self, text: str, symptoms: List[str], nutrients: List[str]) -> str:
         """Infer user intent with more granular categories."""
 
+        # One pass over the text; the ladder below branches on flags
+        flags = {m.lastgroup for m in _INTENT_RE.finditer(text)}
+
         # Feedback/outcome reporting
-        if re.search(r"\b(tried|had|ate|took|drank)\b", text) and re.search(r"\b(great|good|better|helped|didn't|did not|worse|bad)\b", text):
-            if re.search(r"\b(great|good|better|helped|helpful)\b", text):
+        if "verb" in flags and ("pos" in flags or "neg" in flags):
+            if "pos" in flags:
                 return "give_feedback_positive"
             else:
                 return "give_feedback_negative"
@@ -144,11 +167,11 @@ class NLPParser:
             return "report_symptom"
 
         # Requesting a suggestion explicitly
-        if re.search(r"\b(can you suggest|suggest|recommend|what should i|what can i)\b", text):
+        if "suggest" in flags:
             return "request_suggestion"
 
         # Asking question
-        if re.search(r"\b(what|why|how|do you|can you|should|could|is it)\b", text):
+        if "question" in flags:
             return "ask_question"
 
         # Nutrients mentioned → discussing nutrition
@@ -156,7 +179,7 @@ class NLPParser:
             return "discuss_nutrition"
 
         # Greetings / small talk
-        if re.match(r"\s*(hi|hello|hey|good morning|good evening)\b", text):
+        if _is_greeting(text):
             return "greeting"
 
         # Default
@@ -183,21 +206,20 @@ class NLPParser:
         """
         If user says "The spinach suggestion was great", extract the food target.
         Supports multi-word food names.
+
+        Thin wrapper that lowers once; pass pre-lowered text to
+        `_extract_feedback_target` when you already have it.
         """
-        # Look for common patterns around feedback
-        patterns = [
-            r"\b(?:the )?(?P<food>[a-z\s_\-]+?) (?:suggestion|idea|tip|recommendation|food|drink)\b",
-            r"\b(?:i tried|i had|i ate|i took|i tried) (?P<food>[a-z\s_\-]+?) (?:and|,|\.| )",
-            r"\b(?:tried|ate|had) (?P<food>[a-z\s_\-]+?) and .*?(great|good|better|helped|didn't|did not|worse|bad)\b",
-        ]
+        return self._extract_feedback_target(user_input.lower())
 
-        text = user_input.lower()
-        for pat in patterns:
-            m = re.search(pat, text)
+    def _extract_feedback_target(self, text: str) -> Optional[str]:
+        """Extract a feedback food target from pre-lowered text."""
+        for pattern in _FEEDBACK_TARGET_RES:
+            m = pattern.search(text)
             if m:
                 food = m.group("food").strip()
                 # sanitize: keep only alpha/space/hyphen
-                return re.sub(r"[^a-z\s\-]", "", food)
+                return _FOOD_SANITIZE_RE.sub("", food)
 
         return None
 
@@ -205,20 +227,145 @@ class NLPParser:
         """
         Parse outcome reports such as "I tried spinach yesterday and felt great".
 
+        Thin wrapper around the extraction that `parse` already performs;
+        prefer reading `parse(...)["feedback"]` when you have a parse result.
+
         Returns a dict with keys: action (food), outcome (positive/negative), when (optional phrase)
         """
-        pattern = r"(?:i (?:tried|had|ate|took|drank)|tried) (?P<food>[a-z\s_\-]+?)(?: (?:yesterday|today|this morning|last night))?(?: .*? (?P<outcome>great|good|better|helped|didn't|did not|worse|bad|poor|terrible))"
-        m = re.search(pattern, user_input.lower())
+        return self._extract_action_history(user_input.lower())
+
+    def _extract_action_history(self, text: str) -> Optional[Dict]:
+        """Extract an outcome report from pre-lowered text."""
+        m = _ACTION_HISTORY_RE.search(text)
         if m:
-            food = re.sub(r"[^a-z\s\-]", "", m.group("food")).strip()
+            food = _FOOD_SANITIZE_RE.sub("", m.group("food")).strip()
             outcome_text = m.group("outcome")
-            outcome = "positive" if outcome_text in ["great", "good", "better", "helped"] else "negative"
-            when = None
-            if re.search(r"yesterday|today|this morning|last night", user_input.lower()):
-                when = re.search(r"(yesterday|today|this morning|last night)", user_input.lower()).group(0)
+            outcome = "positive" if outcome_text in _POSITIVE_OUTCOMES else "negative"
+            when = m.group("when") or m.group("when2")
+            if when is None:
+                # Rare: phrase sits outside the matched span (e.g. leading
+                # "yesterday i tried ...")
+                when_match = _WHEN_RE.search(text)
+                when = when_match.group(0) if when_match else None
             return {"action": food, "outcome": outcome, "when": when}
 
         return None
 
     def __repr__(self) -> str:
         return f"NLPParser(symptoms={len(self.SYMPTOM_KEYWORDS)}, confidence_ready)"
+
+
+# Precompiled patterns, built once at import so the hot parse() path does
+# zero pattern compilation or re-LRU cache lookups per message.
+# All symptom patterns fused into one alternation with a named group per
+# symptom: one engine pass over the text instead of one per symptom.
+# No IGNORECASE: every caller passes parse()'s pre-lowered text, and
+# case-insensitive matching is measurably slower than plain ASCII.
+_SYMPTOM_UNION = re.compile(
+    "|".join(
+        f"(?P<{name}>{pattern})"
+        for pattern, name in NLPParser.SYMPTOM_KEYWORDS.items()
+    )
+)
+
+# One fused alternation per nutrient: a nutrient is detected with a single
+# scan over its whole keyword set instead of one scan per keyword.
+# (Keywords are shared across nutrients — e.g. "milk", "eggs" — so the
+# per-nutrient searches stay independent.)
+_NUTRIENT_PATTERNS = [
+    (
+        nutrient,
+        re.compile(
+            r"\b(?:" + "|".join(re.escape(kw.lower()) for kw in keywords) + r")\b"
+        ),
+    )
+    for nutrient, keywords in NLPParser.NUTRIENT_KEYWORDS.items()
+]
+
+try:
+    # Optional: Hyperscan compiles all symptom patterns into one
+    # SIMD-accelerated DFA — worthwhile for high-throughput deployments.
+    # It is x86_64-only, so the compiled-regex union stays the default.
+    import hyperscan
+
+    _SYMPTOM_NAMES = tuple(NLPParser.SYMPTOM_KEYWORDS.values())
+    _HS_SYMPTOM_DB = hyperscan.Database()
+    # No CASELESS flag: inputs are pre-lowered, same as the re path.
+    _HS_SYMPTOM_DB.compile(
+        expressions=[p.encode() for p in NLPParser.SYMPTOM_KEYWORDS],
+        ids=list(range(len(_SYMPTOM_NAMES))),
+    )
+except Exception:  # pragma: no cover - hyperscan is optional
+    _HS_SYMPTOM_DB = None
+
+# Sentiment: one word-boundary alternation per polarity replaces ~34
+# substring scans, and stops "good" matching inside "goodbye".
+_POS_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(w) for w in sorted(NLPParser.POSITIVE_WORDS, key=len, reverse=True)) + r")\b"
+)
+_NEG_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(w) for w in sorted(NLPParser.NEGATIVE_WORDS, key=len, reverse=True)) + r")\b"
+)
+
+# Intent detection: all the cascade's vocabularies fused into one
+# alternation. A single finditer pass sets flags and the priority ladder
+# branches on the flags, instead of up to six separate text scans.
+# Group order resolves overlaps at the same position: greeting beats
+# "good", suggestion phrases beat bare question words.
+_INTENT_RE = re.compile(
+    r"(?P<suggest>\b(?:can you suggest|suggest|recommend|what should i|what can i)\b)"
+    r"|(?P<verb>\b(?:tried|had|ate|took|drank)\b)"
+    r"|(?P<pos>\b(?:great|good|better|helped|helpful)\b)"
+    r"|(?P<neg>\b(?:didn't|did not|worse|bad)\b)"
+    r"|(?P<question>\b(?:what|why|how|do you|can you|should|could|is it)\b)"
+)
+
+# Greeting detection is a fixed-prefix test: plain startswith plus a
+# word-boundary char check is far cheaper than the regex engine.
+_GREETINGS = ("good morning", "good evening", "hello", "hey", "hi")
+
+
+# Micro-message fast path: many chat turns are just "thanks!" or "hi".
+# If a short message is nothing but one of these tokens, parse() skips
+# the symptom/nutrient/intent/feedback extractors entirely. fullmatch
+# keeps the guard safe — "ok tired" falls through to the normal path.
+_SHORT_TRIVIAL_RE = re.compile(
+    r"\s*(?:hi|hello|hey|good morning|good evening|thanks|thank you|ok|okay|bye)[\s!.?]*"
+)
+_TRIVIAL_MAX_LEN = 16
+
+
+def _is_greeting(text: str) -> bool:
+    """True if pre-lowered text opens with a greeting word."""
+    stripped = text.lstrip()
+    for greeting in _GREETINGS:
+        if stripped.startswith(greeting):
+            end = len(greeting)
+            # whole-word check: end of string or non-alphanumeric next
+            if len(stripped) == end or not stripped[end].isalnum():
+                return True
+    return False
+
+# Feedback target extraction. The food captures are bounded
+# ([a-z][a-z\s_\-]{0,40}?) and the trailing keyword is a lookahead, so a
+# long adversarial message can't trigger quadratic backtracking (ReDoS)
+# the old unbounded `[a-z\s_\-]+?` allowed.
+_FEEDBACK_TARGET_RES = [
+    re.compile(r"\b(?:the )?(?P<food>[a-z][a-z\s_\-]{0,40}?)(?=\s(?:suggestion|idea|tip|recommendation|food|drink)\b)"),
+    re.compile(r"\b(?:i tried|i had|i ate|i took) (?P<food>[a-z][a-z\s_\-]{0,40}?) (?:and|,|\.| )"),
+    re.compile(r"\b(?:tried|ate|had) (?P<food>[a-z][a-z\s_\-]{0,40}?) and .{0,80}?(great|good|better|helped|didn't|did not|worse|bad)\b"),
+]
+_FOOD_SANITIZE_RE = re.compile(r"[^a-z\s\-]")
+
+# Action-history (outcome report) extraction. The `when` phrase is
+# captured in the same pass (either right after the food or after the
+# outcome); the standalone search only runs if the phrase sits somewhere
+# unusual. Bounded captures, same rationale as the feedback patterns.
+_ACTION_HISTORY_RE = re.compile(
+    r"(?:i (?:tried|had|ate|took|drank)|tried) (?P<food>[a-z][a-z\s_\-]{0,40}?)"
+    r"(?: (?P<when>yesterday|today|this morning|last night))?"
+    r"(?: .{0,80}? (?P<outcome>great|good|better|helped|didn't|did not|worse|bad|poor|terrible))"
+    r"(?: (?P<when2>yesterday|today|this morning|last night))?"
+)
+_WHEN_RE = re.compile(r"yesterday|today|this morning|last night")
+_POSITIVE_OUTCOMES = frozenset({"great", "good", "better", "helped", "helpful"})
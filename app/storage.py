@@ -10,20 +10,47 @@ Behavior:
 """
 from __future__ import annotations
 
+import base64
 import os
 import json
+import secrets
 import sqlite3
+import threading
+import zlib
 from typing import Optional, Tuple
 import logging
 
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 from app.core.state import MaternalBrainState
 from app.core.memory import Memory
 
+try:
+    # Optional: much faster JSON encode/decode, emits/accepts bytes
+    # directly so the utf-8 round-trip disappears from the hot path.
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 LOGGER = logging.getLogger(__name__)
 
 
+def _json_dumps_bytes(obj) -> bytes:
+    """Serialize to JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data):
+    """Parse JSON from bytes/str with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _user_dir(user_id: str, base: str = "data/user_states") -> str:
     return os.path.join(base, user_id)
 
@@ -38,6 +65,87 @@ def _get_key_path(user_dir: str) -> str:
     return os.path.join(user_dir, ".secret.key")
 
 
+# Per-path caches: opening SQLite and re-deriving a Fernet (base64 key
+# parse + AES/HMAC setup) on every save/load is pure per-turn overhead.
+# Keyed by filesystem path so tests/deployments that repoint
+# DEFAULT_BACKEND.base get fresh entries.
+# State/memory JSON is highly repetitive (keys repeat per action), so it
+# is deflated before encryption — compressing afterwards is impossible.
+# A leading version byte distinguishes compressed plaintext from legacy
+# raw JSON (which always starts with "{").
+_PLAINTEXT_COMPRESSED = b"\x01"
+_COMPRESS_LEVEL = 6
+
+
+def _pack_plaintext(raw: bytes) -> bytes:
+    """Compress serialized JSON bytes before encryption."""
+    return _PLAINTEXT_COMPRESSED + zlib.compress(raw, _COMPRESS_LEVEL)
+
+
+def _unpack_plaintext(raw: bytes) -> bytes:
+    """Invert _pack_plaintext; passes legacy uncompressed JSON through."""
+    if raw[:1] == _PLAINTEXT_COMPRESSED:
+        return zlib.decompress(raw[1:])
+    return raw
+
+
+_CACHE_LOCK = threading.Lock()
+_CONN_CACHE: dict = {}  # db path -> sqlite3.Connection
+_CIPHER_CACHE: dict = {}  # key path -> _UserCipher
+
+# Leading byte of AES-GCM blobs. Legacy Fernet tokens are base64 and
+# always start with "g", so the formats can't collide.
+_BLOB_AESGCM = b"\x02"
+
+
+class _UserCipher:
+    """Per-user cipher: AES-GCM for new blobs, Fernet for legacy ones.
+
+    AES-GCM is a single AES-NI pass with raw bytes in/out, vs Fernet's
+    AES-CBC + HMAC-SHA256 + base64 (33% bigger blobs, twice the CPU).
+    Both are derived from the same key file, so old records and
+    cross-device restores keep working.
+    """
+
+    __slots__ = ("_aesgcm", "_fernet")
+
+    def __init__(self, key: bytes):
+        self._aesgcm = AESGCM(base64.urlsafe_b64decode(key))
+        self._fernet = Fernet(key)
+
+    def encrypt(self, data: bytes) -> bytes:
+        nonce = secrets.token_bytes(12)
+        return _BLOB_AESGCM + nonce + self._aesgcm.encrypt(nonce, data, None)
+
+    def decrypt(self, blob: bytes) -> bytes:
+        if blob[:1] == _BLOB_AESGCM:
+            return self._aesgcm.decrypt(bytes(blob[1:13]), bytes(blob[13:]), None)
+        return self._fernet.decrypt(blob)
+
+
+def _get_cipher(user_dir: str) -> _UserCipher:
+    """Cached cipher for this user's key file (loads/creates the key once)."""
+    key_path = _get_key_path(user_dir)
+    with _CACHE_LOCK:
+        cipher = _CIPHER_CACHE.get(key_path)
+    if cipher is None:
+        cipher = _UserCipher(_load_or_create_key(user_dir))
+        with _CACHE_LOCK:
+            _CIPHER_CACHE[key_path] = cipher
+    return cipher
+
+
+def close_user(user_id: str) -> None:
+    """Drop cached connection/cipher for a user (e.g. on logout/shutdown)."""
+    path = DEFAULT_BACKEND._db_path(user_id)
+    key_path = _get_key_path(os.path.dirname(path))
+    with _CACHE_LOCK:
+        conn = _CONN_CACHE.pop(path, None)
+        _CIPHER_CACHE.pop(key_path, None)
+    if conn is not None:
+        conn.close()
+
+
 def _load_or_create_key(user_dir: str) -> bytes:
     key_path = _get_key_path(user_dir)
     if os.path.exists(key_path):
@@ -70,67 +178,76 @@ class LocalEncryptedSQLite:
         d = _ensure_user_dir(user_id, self.base)
         return os.path.join(d, "storage.db")
 
-    def _ensure_db(self, path: str):
-        conn = sqlite3.connect(path)
-        try:
-            conn.execute("""CREATE TABLE IF NOT EXISTS blobs (
-                key TEXT PRIMARY KEY,
-                value BLOB NOT NULL
-            )""")
-            conn.commit()
-        finally:
+    def _connect(self, path: str) -> sqlite3.Connection:
+        """Cached connection for this DB path, created and set up once."""
+        with _CACHE_LOCK:
+            conn = _CONN_CACHE.get(path)
+        if conn is not None:
+            return conn
+
+        conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL + NORMAL sync halves fsyncs per commit and allows
+        # concurrent readers during writes.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("""CREATE TABLE IF NOT EXISTS blobs (
+            key TEXT PRIMARY KEY,
+            value BLOB NOT NULL
+        )""")
+        conn.commit()
+
+        with _CACHE_LOCK:
+            existing = _CONN_CACHE.setdefault(path, conn)
+        if existing is not conn:  # lost a setup race; keep the winner
             conn.close()
+            return existing
+        return conn
+
+    def _ensure_db(self, path: str):
+        self._connect(path)
 
     def save(self, user_id: str, state: MaternalBrainState, memory: Memory) -> None:
         path = self._db_path(user_id)
-        self._ensure_db(path)
-        user_dir = os.path.dirname(path)
-        key = _load_or_create_key(user_dir)
-        f = Fernet(key)
+        f = _get_cipher(os.path.dirname(path))
 
-        sjson = json.dumps(state.to_dict(), ensure_ascii=False).encode("utf-8")
-        mjson = json.dumps(memory.to_dict(), ensure_ascii=False).encode("utf-8")
+        sjson = _json_dumps_bytes(state.to_dict())
+        mjson = _json_dumps_bytes(memory.to_dict())
 
-        s_enc = f.encrypt(sjson)
-        m_enc = f.encrypt(mjson)
+        s_enc = f.encrypt(_pack_plaintext(sjson))
+        m_enc = f.encrypt(_pack_plaintext(mjson))
 
-        conn = sqlite3.connect(path)
-        try:
-            conn.execute("REPLACE INTO blobs (key, value) VALUES (?, ?)", ("state", s_enc))
-            conn.execute("REPLACE INTO blobs (key, value) VALUES (?, ?)", ("memory", m_enc))
-            conn.commit()
-        finally:
-            conn.close()
+        conn = self._connect(path)
+        # Both rows in one transaction: a single commit/fsync pair
+        with conn:
+            conn.executemany(
+                "REPLACE INTO blobs (key, value) VALUES (?, ?)",
+                [("state", s_enc), ("memory", m_enc)],
+            )
 
     def load(self, user_id: str) -> Optional[Tuple[MaternalBrainState, Memory]]:
         path = self._db_path(user_id)
         if not os.path.exists(path):
             return None
 
-        user_dir = os.path.dirname(path)
-        key = _load_or_create_key(user_dir)
-        f = Fernet(key)
+        f = _get_cipher(os.path.dirname(path))
 
-        conn = sqlite3.connect(path)
-        try:
-            cur = conn.execute("SELECT key, value FROM blobs WHERE key IN ('state','memory')")
-            rows = {k: v for k, v in cur.fetchall()}
-        finally:
-            conn.close()
+        conn = self._connect(path)
+        cur = conn.execute("SELECT key, value FROM blobs WHERE key IN ('state','memory')")
+        rows = {k: v for k, v in cur.fetchall()}
 
         if "state" not in rows or "memory" not in rows:
             return None
 
         try:
-            sjson = f.decrypt(rows["state"]).decode("utf-8")
-            mjson = f.decrypt(rows["memory"]).decode("utf-8")
-        except InvalidToken:
+            sjson = _unpack_plaintext(f.decrypt(rows["state"]))
+            mjson = _unpack_plaintext(f.decrypt(rows["memory"]))
+        except (InvalidToken, InvalidTag):
             LOGGER.exception("Failed to decrypt persisted user data; key mismatch")
             return None
 
         try:
-            sdata = json.loads(sjson)
-            mdata = json.loads(mjson)
+            sdata = _json_loads(sjson)
+            mdata = _json_loads(mjson)
             state = MaternalBrainState.from_dict(sdata)
             memory = Memory.from_dict(mdata)
             return state, memory
@@ -183,55 +300,85 @@ def load_user_state(user_id: str) -> Optional[Tuple[MaternalBrainState, Memory]]
 
 ######### Mobile backup / restore helpers #########
 import base64
+import io
+import struct
 import time
 
+# Binary backup container: magic, then a 4-byte big-endian header length,
+# then a JSON header, then the raw encrypted blobs back to back. The
+# blobs are ciphertext already — base64+JSON wrapping (the v1 format)
+# only inflated them by ~33% and cost two extra O(N) passes.
+_BACKUP_MAGIC = b"NMB1"
+
+
+# Blob bytes are streamed out of SQLite in slices of this size, so
+# writing a backup to disk needs O(chunk) memory, not O(package).
+_BACKUP_CHUNK_BYTES = 64 * 1024
 
-def create_backup_package(user_id: str) -> bytes:
-    """Create a portable backup package (bytes) containing the encrypted
-    blobs stored for a user. The package DOES NOT include the encryption
-    key; the receiving device must have the user's key in its secure
-    keystore to decrypt.
 
-    Format (JSON bytes):
-    {
-      "version": 1,
-      "user_id": "...",
-      "created_at": 167...,
-      "blobs": { "state": "BASE64(...)", "memory": "BASE64(...)" }
-    }
+def _iter_backup_chunks(user_id: str):
+    """Yield the backup package as a sequence of byte chunks.
+
+    The header is built from blob lengths only; blob bytes are then read
+    incrementally via `Connection.blobopen`, so the full package never
+    has to exist in memory unless the caller joins it.
     """
-    # Read raw encrypted blobs from DB if present
     path = DEFAULT_BACKEND._db_path(user_id)
     if not os.path.exists(path):
         raise FileNotFoundError("No local storage found for user")
 
-    conn = sqlite3.connect(path)
-    try:
-        cur = conn.execute("SELECT key, value FROM blobs WHERE key IN ('state','memory')")
-        rows = {k: v for k, v in cur.fetchall()}
-    finally:
-        conn.close()
-
+    conn = DEFAULT_BACKEND._connect(path)
+    cur = conn.execute(
+        "SELECT key, rowid, length(value) FROM blobs WHERE key IN ('state','memory')"
+    )
+    rows = cur.fetchall()
     if not rows:
         raise ValueError("No blobs present to back up")
 
-    payload = {
-        "version": 1,
+    header = json.dumps({
+        "version": 2,
         "user_id": user_id,
         "created_at": int(time.time()),
-        "blobs": {k: base64.b64encode(v).decode("ascii") for k, v in rows.items()}
-    }
-    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        "blobs": {key: length for key, _rowid, length in rows}
+    }, ensure_ascii=False).encode("utf-8")
+
+    yield _BACKUP_MAGIC + struct.pack(">I", len(header)) + header
+
+    for _key, rowid, _length in rows:
+        with conn.blobopen("blobs", "value", rowid, readonly=True) as blob:
+            while True:
+                chunk = blob.read(_BACKUP_CHUNK_BYTES)
+                if not chunk:
+                    break
+                yield chunk
+
+
+def create_backup_package(user_id: str) -> bytes:
+    """Create a portable backup package (bytes) containing the encrypted
+    blobs stored for a user. The package DOES NOT include the encryption
+    key; the receiving device must have the user's key in its secure
+    keystore to decrypt.
+
+    Format (v2, binary): b"NMB1" + uint32 header length + JSON header
+    {"version": 2, "user_id": ..., "created_at": ..., "blobs": {name: length}}
+    + the raw blob bytes concatenated in header order. v1 (JSON with
+    base64 blobs) packages are still readable by `load_backup_package`.
+    """
+    return b"".join(_iter_backup_chunks(user_id))
 
 
 def save_backup_to_path(user_id: str, dest_path: str) -> str:
-    """Create backup package and write to `dest_path`. Returns path."""
-    data = create_backup_package(user_id)
+    """Create backup package and write to `dest_path`. Returns path.
+
+    Streams the package chunk by chunk, so peak memory stays O(chunk)
+    even for large memories.
+    """
     d = os.path.dirname(dest_path)
     if d:
         os.makedirs(d, exist_ok=True)
     with open(dest_path, "wb") as f:
-        f.write(data)
+        for chunk in _iter_backup_chunks(user_id):
+            f.write(chunk)
     return dest_path
 
 
@@ -240,23 +387,33 @@ def load_backup_package(user_id: str, package_bytes: bytes) -> None:
     storage. This writes the encrypted blob bytes directly into the DB;
     decryption will only succeed if the device holds the correct key.
     """
-    payload = json.loads(package_bytes.decode("utf-8"))
-    blobs = payload.get("blobs", {})
+    if package_bytes[:4] == _BACKUP_MAGIC:
+        # v2 binary container: header JSON maps blob name -> length
+        (header_len,) = struct.unpack(">I", package_bytes[4:8])
+        header = json.loads(package_bytes[8:8 + header_len].decode("utf-8"))
+        blobs = {}
+        offset = 8 + header_len
+        for k, length in header.get("blobs", {}).items():
+            blobs[k] = package_bytes[offset:offset + length]
+            offset += length
+    else:
+        # v1 JSON container with base64 blobs
+        payload = json.loads(package_bytes.decode("utf-8"))
+        blobs = {
+            k: base64.b64decode(b64.encode("ascii"))
+            for k, b64 in payload.get("blobs", {}).items()
+        }
+
     if not blobs:
         raise ValueError("Backup package contains no blobs")
 
-    # Ensure DB
     db_path = DEFAULT_BACKEND._db_path(user_id)
-    DEFAULT_BACKEND._ensure_db(db_path)
-
-    conn = sqlite3.connect(db_path)
-    try:
-        for k, b64 in blobs.items():
-            raw = base64.b64decode(b64.encode("ascii"))
-            conn.execute("REPLACE INTO blobs (key, value) VALUES (?, ?)", (k, raw))
-        conn.commit()
-    finally:
-        conn.close()
+    conn = DEFAULT_BACKEND._connect(db_path)
+    with conn:
+        conn.executemany(
+            "REPLACE INTO blobs (key, value) VALUES (?, ?)",
+            list(blobs.items()),
+        )
 
 
 def get_backup_bytes_for_mobile(user_id: str) -> bytes:
@@ -266,3 +423,11 @@ def get_backup_bytes_for_mobile(user_id: str) -> bytes:
     return create_backup_package(user_id)
 
 
+def get_backup_stream_for_mobile(user_id: str) -> Tuple[io.IOBase, int]:
+    """Like `get_backup_bytes_for_mobile` but returns a readable stream and
+    its total length, for chunked/resumable cloud uploads.
+    """
+    data = create_backup_package(user_id)
+    return io.BytesIO(data), len(data)
+
+
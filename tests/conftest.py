@@ -0,0 +1,34 @@
+import copy
+import sys
+from pathlib import Path
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pytest
+
+from app.interface.responder import Responder
+from app.llm_client import LLMClient
+from app.core.safety import SafetyChecker
+
+
+@pytest.fixture(scope="session")
+def responder_template():
+    """Build the template-heavy Responder once per session."""
+    return Responder()
+
+
+@pytest.fixture
+def responder(responder_template):
+    """Per-test shallow copy of the template with fresh llm/safety/log.
+
+    copy.copy shares the immutable template tables but re-binds every
+    mutable or stateful attribute, so tests can swap in dummy LLMs or
+    patched safety checkers without touching the shared template.
+    """
+    r = copy.copy(responder_template)
+    r._llm = LLMClient.from_env()
+    r._safety = SafetyChecker()
+    r.responses_generated = 0
+    r.response_log = []
+    return r
@@ -1,26 +1,26 @@
 import os
-import json
-import shutil
-from pathlib import Path
 
 import pytest
 
-import sys
-from pathlib import Path
-# Ensure repository root is on sys.path when running tests
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
 import app.storage as storage
 from app.core.state import MaternalBrainState
 from app.core.memory import Memory
 
 
-def test_backup_and_restore_cycle(tmp_path):
-    # Point backend to temporary base
-    base = tmp_path / "user_states"
-    storage.DEFAULT_BACKEND.base = str(base)
+@pytest.fixture
+def backend_base(tmp_path_factory, monkeypatch):
+    """Fresh storage base per test, with DEFAULT_BACKEND pointed at it.
+
+    monkeypatch restores the original base afterwards, so the module-level
+    backend doesn't stay repointed for whatever test module runs next.
+    """
+    base = tmp_path_factory.mktemp("user_states")
+    monkeypatch.setattr(storage.DEFAULT_BACKEND, "base", str(base))
+    return base
+
+
+def test_backup_and_restore_cycle(backend_base):
+    base = backend_base
 
     # Create initial state and memory
     user_a = "user_a"
@@ -45,11 +45,15 @@ def test_backup_and_restore_cycle(tmp_path):
     user_b_dir = base / user_b
     os.makedirs(user_b_dir, exist_ok=True)
 
-    # Copy secret key to new user
+    # Share secret key with new user (hard link avoids copying bytes;
+    # fall back to a plain byte copy on filesystems without link support)
     key_src = user_a_dir / ".secret.key"
     key_dst = user_b_dir / ".secret.key"
     assert key_src.exists()
-    shutil.copy(key_src, key_dst)
+    try:
+        os.link(key_src, key_dst)
+    except OSError:
+        key_dst.write_bytes(key_src.read_bytes())
 
     # Load backup package into user_b
     storage.load_backup_package(user_b, pkg)
@@ -68,8 +72,7 @@ def test_backup_and_restore_cycle(tmp_path):
     assert lmem.actions[0].action_text == mem.actions[0].action_text
 
 
-def test_save_backup_to_path_and_load(tmp_path):
-    storage.DEFAULT_BACKEND.base = str(tmp_path / "user_states2")
+def test_save_backup_to_path_and_load(backend_base, tmp_path):
     user = "user_c"
     state = MaternalBrainState()
     mem = Memory(user)
@@ -78,5 +81,8 @@ def test_save_backup_to_path_and_load(tmp_path):
     out = tmp_path / "backup.json"
     path = storage.save_backup_to_path(user, str(out))
     assert os.path.exists(path)
-    data = out.read_bytes()
-    assert b"blobs" in data
+    # The container header (with its "blobs" manifest) sits at the front;
+    # no need to slurp the whole package to check for it
+    with out.open("rb") as f:
+        head = f.read(8192)
+    assert b"blobs" in head
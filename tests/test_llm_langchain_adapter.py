@@ -1,39 +1,54 @@
 import sys
-from pathlib import Path
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-import importlib
 import types
 import pytest
 
 from app.llm_langchain_adapter import LangChainAdapter
 from app.core.safety import SafetyChecker
 
+# Stand-in module for "langchain is importable"; it carries no attributes
+# the adapter uses, so one shared instance serves every test.
+FAKE_LANGCHAIN = types.ModuleType("langchain")
+
+
+class DummyClient:
+    """Canned LLM client: records the last call, replies via `reply`.
+
+    `reply` may be a plain string or a callable taking the ctx kwargs,
+    so each test picks its behaviour without redefining the class.
+    """
+
+    def __init__(self, reply="OK"):
+        self._reply = reply
+        self.calls = {}
 
-def test_adapter_unavailable_when_langchain_missing(monkeypatch):
-    # Ensure langchain import fails
-    monkeypatch.setitem(sys.modules, "langchain", None)
+    def generate(self, prompt, **ctx):
+        self.calls['prompt'] = prompt
+        self.calls['ctx'] = ctx
+        return self._reply(ctx) if callable(self._reply) else self._reply
+
+
+@pytest.fixture
+def fake_langchain(monkeypatch):
+    """Make `import langchain` succeed for the duration of a test."""
+    monkeypatch.setitem(sys.modules, "langchain", FAKE_LANGCHAIN)
+
+
+@pytest.mark.parametrize("langchain_module", [None, FAKE_LANGCHAIN],
+                         ids=["langchain-missing", "client-missing"])
+def test_adapter_generate_raises_without_prerequisites(monkeypatch, langchain_module):
+    # Same failure mode whether langchain can't import or no client is set
+    monkeypatch.setitem(sys.modules, "langchain", langchain_module)
     adapter = LangChainAdapter()
-    assert adapter.available is False
+    if langchain_module is None:
+        assert adapter.available is False
     with pytest.raises(RuntimeError):
         adapter.generate("hello {name}", {"name": "A"})
 
 
-def test_adapter_refuses_unsafe_prompt(monkeypatch):
-    # Simulate langchain present
-    fake = types.ModuleType("langchain")
-    monkeypatch.setitem(sys.modules, "langchain", fake)
-
-    # Provide dummy client
-    class DummyClient:
-        def generate(self, prompt, **ctx):
-            return "OK"
-
+def test_adapter_refuses_unsafe_prompt(fake_langchain):
     s = SafetyChecker()
-    # Force unsafe
-    monkeypatch.setattr(SafetyChecker, "is_prompt_safe", lambda self, p: False)
+    # Force unsafe on this instance only; the class stays untouched
+    s.is_prompt_safe = lambda p: False
     adapter = LangChainAdapter(safety=s)
     adapter.set_client(DummyClient())
 
@@ -41,34 +56,16 @@ def test_adapter_refuses_unsafe_prompt(monkeypatch):
         adapter.generate("tell me how to prescribe aspirin", {})
 
 
-def test_adapter_calls_client_with_safe_prompt(monkeypatch):
-    fake = types.ModuleType("langchain")
-    monkeypatch.setitem(sys.modules, "langchain", fake)
-
-    called = {}
-
-    class DummyClient:
-        def generate(self, prompt, **ctx):
-            called['prompt'] = prompt
-            called['ctx'] = ctx
-            return f"Hello {ctx.get('name')}"
-
+def test_adapter_calls_client_with_safe_prompt(fake_langchain):
     s = SafetyChecker()
-    monkeypatch.setattr(SafetyChecker, "is_prompt_safe", lambda self, p: True)
+    s.is_prompt_safe = lambda p: True
 
+    client = DummyClient(lambda ctx: f"Hello {ctx.get('name')}")
     adapter = LangChainAdapter(safety=s)
-    adapter.set_client(DummyClient())
+    adapter.set_client(client)
 
     out = adapter.generate("Hello {name}", {"name": "Tester"})
     assert out == "Hello Tester"
-    assert called['prompt'] == "Hello {name}"
-    assert called['ctx'] == {"name": "Tester"}
+    assert client.calls['prompt'] == "Hello {name}"
+    assert client.calls['ctx'] == {"name": "Tester"}
 
-
-def test_adapter_requires_client(monkeypatch):
-    fake = types.ModuleType("langchain")
-    monkeypatch.setitem(sys.modules, "langchain", fake)
-
-    adapter = LangChainAdapter()
-    with pytest.raises(RuntimeError):
-        adapter.generate("Hello {name}", {"name": "A"})
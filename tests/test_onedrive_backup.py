@@ -1,21 +1,21 @@
-import sys
-from pathlib import Path
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-import os
-import json
-import tempfile
-from unittest.mock import MagicMock
+import pytest
 
 import app.onedrive_backup as od
 
 
+@pytest.fixture(scope="session")
+def empty_cache(tmp_path_factory):
+    """One empty MSAL cache file for the session; tests only read it."""
+    cache = tmp_path_factory.mktemp("msal") / "cache.json"
+    cache.write_text("{}")
+    return cache
+
+
 class DummyApp:
     def __init__(self, token=None):
         self._token = token or {"access_token": "fake-token"}
-        self._cache = MagicMock()
+        # Never read by the code under test; a bare sentinel is enough
+        self._cache = object()
 
     def get_accounts(self):
         return ["acct"]
@@ -27,47 +27,57 @@ class DummyApp:
         return "{}"
 
 
-def test_upload_calls_graph(monkeypatch, tmp_path):
-    # Create dummy cache file
-    cache = tmp_path / "cache.json"
-    cache.write_text("{}")
+class UploadResp:
+    def raise_for_status(self):
+        pass
 
-    # Mock _load_app_from_cache to return DummyApp
-    monkeypatch.setattr(od, "_load_app_from_cache", lambda client_id, cache_path: (DummyApp(), None))
+    def json(self):
+        return {"id": "file123"}
 
-    # Avoid reading actual DB; mock package generation
-    monkeypatch.setattr("app.storage.get_backup_bytes_for_mobile", lambda uid: b'{"dummy": true}')
 
-    # Mock requests.put
-    class DummyResp:
-        def raise_for_status(self):
-            pass
+class DownloadResp:
+    content = b"backup-binary"
 
-        def json(self):
-            return {"id": "file123"}
+    def raise_for_status(self):
+        pass
 
-    monkeypatch.setattr("requests.put", lambda url, headers, data: DummyResp())
 
-    # Now call upload
-    fid = od.upload_backup_to_onedrive("user_a", "cliid", str(cache), "backup.json")
-    assert fid == "file123"
+class UploadSession:
+    def put(self, url, headers, data):
+        return UploadResp()
 
 
-def test_download_calls_graph(monkeypatch, tmp_path):
-    cache = tmp_path / "cache.json"
-    cache.write_text("{}")
+class DownloadSession:
+    def get(self, url, headers, stream=True):
+        return DownloadResp()
+
 
-    monkeypatch.setattr(od, "_load_app_from_cache", lambda client_id, cache_path: (DummyApp(), None))
+def _fake_load_app(client_id, cache_path):
+    return DummyApp(), None
 
-    class DummyResp:
-        def raise_for_status(self):
-            pass
 
-        @property
-        def content(self):
-            return b"backup-binary"
+def _fake_backup_bytes(uid):
+    return b'{"dummy": true}'
+
+
+def test_upload_calls_graph(monkeypatch, empty_cache):
+    # Mock _load_app_from_cache to return DummyApp
+    monkeypatch.setattr(od, "_load_app_from_cache", _fake_load_app)
+
+    # Avoid reading actual DB; mock package generation
+    monkeypatch.setattr("app.storage.get_backup_bytes_for_mobile", _fake_backup_bytes)
+
+    # Mock the shared HTTP session's put
+    monkeypatch.setattr(od, "_get_session", UploadSession)
+
+    # Now call upload
+    fid = od.upload_backup_to_onedrive("user_a", "cliid", str(empty_cache), "backup.json")
+    assert fid == "file123"
+
 
-    monkeypatch.setattr("requests.get", lambda url, headers, stream=True: DummyResp())
+def test_download_calls_graph(monkeypatch, empty_cache):
+    monkeypatch.setattr(od, "_load_app_from_cache", _fake_load_app)
+    monkeypatch.setattr(od, "_get_session", DownloadSession)
 
-    data = od.download_backup_from_onedrive("file123", "cliid", str(cache))
+    data = od.download_backup_from_onedrive("file123", "cliid", str(empty_cache))
     assert data == b"backup-binary"
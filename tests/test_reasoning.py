@@ -1,52 +1,67 @@
-import sys
-from pathlib import Path
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from datetime import datetime
 
 from app.core.reasoning import ReasoningEngine, ActionType
 from app.core.state import MaternalBrainState
 from app.core.memory import Memory
 from app.core.safety import SafetyChecker
 
+import pytest
 
-def test_alert_on_critical_nutrient():
-    state = MaternalBrainState()
-    mem = Memory("user_x")
-    safety = SafetyChecker()
-    engine = ReasoningEngine()
 
+@pytest.fixture(scope="session")
+def engine():
+    """ReasoningEngine is stateless between decide() calls; build once."""
+    return ReasoningEngine()
+
+
+@pytest.fixture(scope="session")
+def _safety_instance():
+    return SafetyChecker()
+
+
+@pytest.fixture
+def safety(_safety_instance):
+    # One checker for the session, but alerts/violations accumulate across
+    # decide() calls, so reset them before each test.
+    _safety_instance.clear_alerts()
+    _safety_instance.clear_violations()
+    return _safety_instance
+
+
+@pytest.fixture
+def state():
+    return MaternalBrainState()
+
+
+@pytest.fixture
+def mem():
+    # Memory.__init__ is pure in-memory (no storage reads), so a fresh
+    # instance per test is cheap and needs no IO stubbing.
+    return Memory("test_user")
+
+
+def test_alert_on_critical_nutrient(engine, safety, state, mem):
     # Make iron critically low and confident
     state.nutrition["iron"] = 0.15
     state.confidence_in_state["iron"] = 0.85
 
-    action_type, details, reason = engine.decide(state, mem, safety)
+    action_type, details, reason, display = engine.decide(state, mem, safety)
     assert action_type == ActionType.ALERT_MEDICAL
     assert "critical" in reason.lower() or "medical" in reason.lower()
 
 
-def test_suggests_food_for_low_nutrient():
-    state = MaternalBrainState()
-    mem = Memory("user_y")
-    safety = SafetyChecker()
-    engine = ReasoningEngine()
-
+def test_suggests_food_for_low_nutrient(engine, safety, state, mem):
     state.nutrition["iron"] = 0.35
     state.confidence_in_state["iron"] = 0.9
 
-    action_type, details, reason = engine.decide(state, mem, safety)
+    action_type, details, reason, display = engine.decide(state, mem, safety)
     assert action_type in (ActionType.SUGGEST_FOOD, ActionType.CHECK_IN)
     if action_type == ActionType.SUGGEST_FOOD:
         assert details["nutrient"] == "iron"
         assert details["food"] in engine._get_foods_for_nutrient("iron")
 
 
-def test_avoids_failed_suggestions():
-    state = MaternalBrainState()
-    mem = Memory("user_z")
-    safety = SafetyChecker()
-    engine = ReasoningEngine()
-
+def test_avoids_failed_suggestions(engine, safety, state, mem):
     # Setup nutrient low
     state.nutrition["iron"] = 0.35
     state.confidence_in_state["iron"] = 0.9
@@ -55,20 +70,14 @@ def test_avoids_failed_suggestions():
     mem.failed_suggestions["spinach"] = 1
     mem.dislikes.add("spinach")
 
-    action_type, details, reason = engine.decide(state, mem, safety)
+    action_type, details, reason, display = engine.decide(state, mem, safety)
     if action_type == ActionType.SUGGEST_FOOD:
         assert details["food"] != "spinach"
 
 
-def test_only_one_action_per_day():
-    state = MaternalBrainState()
-    mem = Memory("user_q")
-    safety = SafetyChecker()
-    engine = ReasoningEngine()
-
+def test_only_one_action_per_day(engine, safety, state, mem):
     # set recent action date to now
-    from datetime import datetime
     state.last_action_date = datetime.utcnow()
 
-    action_type, details, reason = engine.decide(state, mem, safety)
+    action_type, details, reason, display = engine.decide(state, mem, safety)
     assert action_type == ActionType.OBSERVE